@@ -7,10 +7,13 @@ independent and comprehensive research from multiple angles.
 Task ID: 2.6.1 - 2.6.7 from IMPLEMENTATION-TRACKER.md
 """
 
+import functools
+import sys
 from enum import StrEnum
+from typing import Any
 
 import structlog
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 from oracle.agents.base import AgentConfig, SearchStrategy
 
@@ -46,8 +49,15 @@ class StrategyConfig(BaseModel):
     Detailed configuration for a search strategy.
 
     Task 2.6.2: Define StrategyConfig.
+
+    Configs are frozen and the domain and template fields are tuples, so the
+    values cached in model_post_init (category requirements, split query
+    templates) stay valid. category_weights is still a plain dict; treat it
+    as read-only.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     profile: StrategyProfile
     description: str
 
@@ -55,16 +65,16 @@ class StrategyConfig(BaseModel):
     temperature: float = Field(default=0.1, ge=0.0, le=2.0)
     max_tokens: int = Field(default=8192)
 
-    # Source preferences
-    preferred_domains: list[str] = Field(default_factory=list)
-    excluded_domains: list[str] = Field(default_factory=list)
+    # Source preferences (domain strings are interned; many profiles share them)
+    preferred_domains: tuple[str, ...] = Field(default_factory=tuple)
+    excluded_domains: tuple[str, ...] = Field(default_factory=tuple)
     min_sources: int = Field(default=50)
 
     # Category weighting (total should sum to ~100)
     category_weights: dict[str, int] = Field(default_factory=dict)
 
     # Search query templates
-    query_templates: list[str] = Field(default_factory=list)
+    query_templates: tuple[str, ...] = Field(default_factory=tuple)
 
     # Verification emphasis
     verification_focus: str = Field(
@@ -74,6 +84,36 @@ class StrategyConfig(BaseModel):
     # Prompt customization
     system_prompt_additions: str = Field(default="")
 
+    # Invariants derived from the fields above, computed once per config
+    _category_requirements: dict[str, int] = PrivateAttr(default_factory=dict)
+    _compiled_templates: tuple[tuple[str, ...], ...] = PrivateAttr(default_factory=tuple)
+
+    @field_validator("preferred_domains", "excluded_domains", mode="after")
+    @classmethod
+    def _intern_domains(cls, domains: tuple[str, ...]) -> tuple[str, ...]:
+        return tuple(sys.intern(d) for d in domains)
+
+    def model_post_init(self, __context: Any) -> None:
+        # Scale category weights to absolute source counts
+        total_weight = sum(self.category_weights.values())
+        if total_weight > 0:
+            self._category_requirements = {
+                cat: max(1, int(self.min_sources * weight / total_weight))
+                for cat, weight in self.category_weights.items()
+            }
+
+        # Pre-split templates so query generation is a plain join
+        self._compiled_templates = tuple(tuple(t.split("{question}")) for t in self.query_templates)
+
+    @property
+    def category_requirements(self) -> dict[str, int]:
+        """Minimum source count per category, derived from the weights."""
+        return dict(self._category_requirements)
+
+    def format_queries(self, question: str) -> list[str]:
+        """Fill every query template with the given question."""
+        return [question.join(parts) for parts in self._compiled_templates]
+
 
 # ============================================================================
 # Predefined Strategy Configurations
@@ -91,7 +131,7 @@ STRATEGY_CONFIGS: dict[StrategyProfile, StrategyConfig] = {
             "social": 15,
             "fact_check": 10,
         },
-        query_templates=[
+        query_templates=(
             "{question}",
             "{question} latest news",
             "{question} official announcement",
@@ -100,14 +140,14 @@ STRATEGY_CONFIGS: dict[StrategyProfile, StrategyConfig] = {
             "{question} AP news BBC",
             "{question} analysis expert",
             "{question} update 2024 2025",
-        ],
+        ),
         verification_focus="balanced",
     ),
     StrategyProfile.FOCUSED_OFFICIAL: StrategyConfig(
         profile=StrategyProfile.FOCUSED_OFFICIAL,
         description="Focus on official government and regulatory sources",
         temperature=0.05,
-        preferred_domains=[
+        preferred_domains=(
             ".gov",
             ".gov.uk",
             "sec.gov",
@@ -115,20 +155,20 @@ STRATEGY_CONFIGS: dict[StrategyProfile, StrategyConfig] = {
             "europa.eu",
             "un.org",
             "who.int",
-        ],
+        ),
         category_weights={
             "official": 50,
             "news": 30,
             "domain_specific": 15,
             "fact_check": 5,
         },
-        query_templates=[
+        query_templates=(
             '"{question}" site:gov',
             '"{question}" official announcement',
             '"{question}" government statement',
             '"{question}" regulatory filing',
             '"{question}" press release official',
-        ],
+        ),
         verification_focus="confirming",
         system_prompt_additions=(
             "Prioritize official government sources, regulatory filings, "
@@ -139,7 +179,7 @@ STRATEGY_CONFIGS: dict[StrategyProfile, StrategyConfig] = {
         profile=StrategyProfile.NEWS_CENTRIC,
         description="Focus on major news outlets and wire services",
         temperature=0.1,
-        preferred_domains=[
+        preferred_domains=(
             "reuters.com",
             "apnews.com",
             "bbc.com",
@@ -151,21 +191,21 @@ STRATEGY_CONFIGS: dict[StrategyProfile, StrategyConfig] = {
             "ft.com",
             "theguardian.com",
             "cnbc.com",
-        ],
+        ),
         category_weights={
             "news": 60,
             "official": 20,
             "domain_specific": 15,
             "fact_check": 5,
         },
-        query_templates=[
+        query_templates=(
             "{question} site:reuters.com",
             "{question} site:apnews.com",
             "{question} site:bbc.com OR site:bbc.co.uk",
             "{question} site:bloomberg.com",
             "{question} breaking news",
             "{question} latest report",
-        ],
+        ),
         verification_focus="balanced",
     ),
     StrategyProfile.SKEPTICAL: StrategyConfig(
@@ -179,7 +219,7 @@ STRATEGY_CONFIGS: dict[StrategyProfile, StrategyConfig] = {
             "domain_specific": 15,
             "social": 10,
         },
-        query_templates=[
+        query_templates=(
             "{question} false",
             "{question} debunked",
             "{question} not true",
@@ -188,7 +228,7 @@ STRATEGY_CONFIGS: dict[StrategyProfile, StrategyConfig] = {
             "{question} failed OR denied",
             "{question} misinformation",
             "{question} fact check",
-        ],
+        ),
         verification_focus="disconfirming",
         system_prompt_additions=(
             "Actively look for evidence that contradicts the expected outcome. "
@@ -200,34 +240,34 @@ STRATEGY_CONFIGS: dict[StrategyProfile, StrategyConfig] = {
         profile=StrategyProfile.FACT_CHECK,
         description="Focus on fact-checking organizations and verification",
         temperature=0.05,
-        preferred_domains=[
+        preferred_domains=(
             "snopes.com",
             "factcheck.org",
             "politifact.com",
             "fullfact.org",
             "apnews.com/hub/ap-fact-check",
             "reuters.com/fact-check",
-        ],
+        ),
         category_weights={
             "fact_check": 50,
             "official": 25,
             "news": 20,
             "domain_specific": 5,
         },
-        query_templates=[
+        query_templates=(
             "{question} fact check",
             "{question} site:snopes.com",
             "{question} site:factcheck.org",
             "{question} verified OR confirmed",
             "{question} true or false",
-        ],
+        ),
         verification_focus="confirming",
     ),
     StrategyProfile.CRYPTO_FINANCIAL: StrategyConfig(
         profile=StrategyProfile.CRYPTO_FINANCIAL,
         description="Focus on crypto and financial sources",
         temperature=0.1,
-        preferred_domains=[
+        preferred_domains=(
             "coindesk.com",
             "cointelegraph.com",
             "theblock.co",
@@ -236,47 +276,47 @@ STRATEGY_CONFIGS: dict[StrategyProfile, StrategyConfig] = {
             "wsj.com",
             "coingecko.com",
             "coinmarketcap.com",
-        ],
+        ),
         category_weights={
             "domain_specific": 50,
             "news": 25,
             "official": 15,
             "social": 10,
         },
-        query_templates=[
+        query_templates=(
             "{question} crypto",
             "{question} site:coindesk.com",
             "{question} site:cointelegraph.com",
             "{question} bitcoin ethereum",
             "{question} blockchain",
             "{question} price market",
-        ],
+        ),
         verification_focus="balanced",
     ),
     StrategyProfile.SOCIAL_SENTIMENT: StrategyConfig(
         profile=StrategyProfile.SOCIAL_SENTIMENT,
         description="Analyze social media sentiment and discussions",
         temperature=0.2,
-        preferred_domains=[
+        preferred_domains=(
             "twitter.com",
             "x.com",
             "reddit.com",
             "discord.com",
             "telegram.org",
-        ],
+        ),
         category_weights={
             "social": 50,
             "news": 25,
             "domain_specific": 15,
             "official": 10,
         },
-        query_templates=[
+        query_templates=(
             "{question} site:twitter.com OR site:x.com",
             "{question} site:reddit.com",
             "{question} trending",
             "{question} viral",
             "{question} community reaction",
-        ],
+        ),
         verification_focus="balanced",
         system_prompt_additions=(
             "Analyze social media sentiment and community discussions. "
@@ -295,13 +335,13 @@ STRATEGY_CONFIGS: dict[StrategyProfile, StrategyConfig] = {
             "social": 20,
             "fact_check": 15,
         },
-        query_templates=[
+        query_templates=(
             "{question} analysis",
             "{question} opinion editorial",
             "{question} different perspectives",
             "{question} debate",
             "{question} supporters critics",
-        ],
+        ),
         verification_focus="balanced",
         system_prompt_additions=(
             "Seek diverse perspectives on the topic. "
@@ -319,12 +359,12 @@ STRATEGY_CONFIGS: dict[StrategyProfile, StrategyConfig] = {
             "domain_specific": 20,
             "fact_check": 20,
         },
-        query_templates=[
+        query_templates=(
             "{question} multiple sources",
             "{question} confirmed by",
             "{question} according to",
             "{question} independently verified",
-        ],
+        ),
         verification_focus="confirming",
         system_prompt_additions=(
             "Focus on cross-referencing key facts across multiple independent sources. "
@@ -336,31 +376,57 @@ STRATEGY_CONFIGS: dict[StrategyProfile, StrategyConfig] = {
         profile=StrategyProfile.ACADEMIC,
         description="Focus on academic and research sources",
         temperature=0.1,
-        preferred_domains=[
+        preferred_domains=(
             ".edu",
             "arxiv.org",
             "scholar.google.com",
             "researchgate.net",
             "nature.com",
             "science.org",
-        ],
+        ),
         category_weights={
             "official": 40,
             "domain_specific": 40,
             "news": 15,
             "fact_check": 5,
         },
-        query_templates=[
+        query_templates=(
             "{question} research paper",
             "{question} site:arxiv.org",
             "{question} academic study",
             "{question} peer reviewed",
-        ],
+        ),
         verification_focus="confirming",
     ),
 }
 
 
+# Recommended combination for maximum diversity
+_RECOMMENDED_PROFILES: tuple[StrategyProfile, ...] = (
+    StrategyProfile.COMPREHENSIVE,  # Broad coverage
+    StrategyProfile.FOCUSED_OFFICIAL,  # Official sources
+    StrategyProfile.NEWS_CENTRIC,  # News coverage
+    StrategyProfile.SKEPTICAL,  # Counter-evidence
+    StrategyProfile.FACT_CHECK,  # Verification
+    StrategyProfile.DIVERSE_PERSPECTIVES,  # Multiple viewpoints
+    StrategyProfile.CROSS_REFERENCE,  # Cross-verification
+)
+
+# Profile -> base SearchStrategy, built once rather than on every lookup
+_SEARCH_STRATEGIES: dict[StrategyProfile, SearchStrategy] = {
+    StrategyProfile.COMPREHENSIVE: SearchStrategy.COMPREHENSIVE,
+    StrategyProfile.FOCUSED_OFFICIAL: SearchStrategy.FOCUSED,
+    StrategyProfile.NEWS_CENTRIC: SearchStrategy.FOCUSED,
+    StrategyProfile.SKEPTICAL: SearchStrategy.SKEPTICAL,
+    StrategyProfile.FACT_CHECK: SearchStrategy.FOCUSED,
+    StrategyProfile.CRYPTO_FINANCIAL: SearchStrategy.FOCUSED,
+    StrategyProfile.SOCIAL_SENTIMENT: SearchStrategy.DIVERSE,
+    StrategyProfile.DIVERSE_PERSPECTIVES: SearchStrategy.DIVERSE,
+    StrategyProfile.CROSS_REFERENCE: SearchStrategy.COMPREHENSIVE,
+    StrategyProfile.ACADEMIC: SearchStrategy.FOCUSED,
+}
+
+
 class StrategyFactory:
     """
     Factory for creating agent configurations based on strategy profiles.
@@ -375,10 +441,11 @@ class StrategyFactory:
 
         Task 2.6.4: Implement get_config().
         """
-        if profile not in STRATEGY_CONFIGS:
+        config = STRATEGY_CONFIGS.get(profile)
+        if config is None:
             logger.warning(f"Unknown strategy profile: {profile}, using COMPREHENSIVE")
             return STRATEGY_CONFIGS[StrategyProfile.COMPREHENSIVE]
-        return STRATEGY_CONFIGS[profile]
+        return config
 
     @staticmethod
     def get_agent_config(profile: StrategyProfile) -> AgentConfig:
@@ -389,40 +456,18 @@ class StrategyFactory:
         """
         strategy_config = StrategyFactory.get_config(profile)
 
-        # Convert category weights to requirements
-        # Assuming min_sources = 50, scale weights to absolute numbers
-        min_sources = strategy_config.min_sources
-        category_requirements = {}
-
-        total_weight = sum(strategy_config.category_weights.values())
-        if total_weight > 0:
-            for cat, weight in strategy_config.category_weights.items():
-                category_requirements[cat] = max(1, int(min_sources * weight / total_weight))
-
         return AgentConfig(
-            min_sources=min_sources,
+            min_sources=strategy_config.min_sources,
             min_categories=len(strategy_config.category_weights),
             temperature=strategy_config.temperature,
             max_tokens=strategy_config.max_tokens,
-            category_requirements=category_requirements,
+            category_requirements=strategy_config.category_requirements,
         )
 
     @staticmethod
     def get_search_strategy(profile: StrategyProfile) -> SearchStrategy:
         """Map profile to base SearchStrategy enum."""
-        mapping = {
-            StrategyProfile.COMPREHENSIVE: SearchStrategy.COMPREHENSIVE,
-            StrategyProfile.FOCUSED_OFFICIAL: SearchStrategy.FOCUSED,
-            StrategyProfile.NEWS_CENTRIC: SearchStrategy.FOCUSED,
-            StrategyProfile.SKEPTICAL: SearchStrategy.SKEPTICAL,
-            StrategyProfile.FACT_CHECK: SearchStrategy.FOCUSED,
-            StrategyProfile.CRYPTO_FINANCIAL: SearchStrategy.FOCUSED,
-            StrategyProfile.SOCIAL_SENTIMENT: SearchStrategy.DIVERSE,
-            StrategyProfile.DIVERSE_PERSPECTIVES: SearchStrategy.DIVERSE,
-            StrategyProfile.CROSS_REFERENCE: SearchStrategy.COMPREHENSIVE,
-            StrategyProfile.ACADEMIC: SearchStrategy.FOCUSED,
-        }
-        return mapping.get(profile, SearchStrategy.COMPREHENSIVE)
+        return _SEARCH_STRATEGIES.get(profile, SearchStrategy.COMPREHENSIVE)
 
     @staticmethod
     def generate_queries(profile: StrategyProfile, question: str) -> list[str]:
@@ -431,14 +476,7 @@ class StrategyFactory:
 
         Task 2.6.6: Implement generate_queries().
         """
-        config = StrategyFactory.get_config(profile)
-        queries = []
-
-        for template in config.query_templates:
-            query = template.format(question=question)
-            queries.append(query)
-
-        return queries
+        return StrategyFactory.get_config(profile).format_queries(question)
 
     @staticmethod
     def get_recommended_profiles(
@@ -454,38 +492,40 @@ class StrategyFactory:
         if agent_count <= 0:
             return []
 
-        # Recommended combination for maximum diversity
-        recommended = [
-            StrategyProfile.COMPREHENSIVE,  # Broad coverage
-            StrategyProfile.FOCUSED_OFFICIAL,  # Official sources
-            StrategyProfile.NEWS_CENTRIC,  # News coverage
-            StrategyProfile.SKEPTICAL,  # Counter-evidence
-            StrategyProfile.FACT_CHECK,  # Verification
-            StrategyProfile.DIVERSE_PERSPECTIVES,  # Multiple viewpoints
-            StrategyProfile.CROSS_REFERENCE,  # Cross-verification
-        ]
+        recommended = _RECOMMENDED_PROFILES
 
         # Return requested number
         if agent_count <= len(recommended):
-            return recommended[:agent_count]
+            return list(recommended[:agent_count])
 
-        # If more agents needed, repeat with slight variation
-        result = recommended.copy()
-        while len(result) < agent_count:
-            # Add more agents with slightly different configs
-            result.extend(recommended[: agent_count - len(result)])
+        # If more agents needed, cycle through the recommended profiles
+        n = len(recommended)
+        return [recommended[i % n] for i in range(agent_count)]
 
-        return result[:agent_count]
+    @staticmethod
+    def get_recommended_strategy_names(agent_count: int = 5) -> list[str]:
+        """Get the values of get_recommended_profiles(), as stored in oracle configs."""
+        return list(_recommended_strategy_names(agent_count))
 
     @staticmethod
     def list_all_profiles() -> list[dict]:
         """List all available strategy profiles with descriptions."""
-        return [
-            {
-                "profile": profile.value,
-                "description": config.description,
-                "verification_focus": config.verification_focus,
-                "category_weights": config.category_weights,
-            }
-            for profile, config in STRATEGY_CONFIGS.items()
-        ]
+        return [dict(summary) for summary in _profile_summaries()]
+
+
+@functools.lru_cache(maxsize=64)
+def _recommended_strategy_names(agent_count: int) -> tuple[str, ...]:
+    return tuple(p.value for p in StrategyFactory.get_recommended_profiles(agent_count))
+
+
+@functools.cache
+def _profile_summaries() -> tuple[dict, ...]:
+    return tuple(
+        {
+            "profile": profile.value,
+            "description": config.description,
+            "verification_focus": config.verification_focus,
+            "category_weights": config.category_weights,
+        }
+        for profile, config in STRATEGY_CONFIGS.items()
+    )
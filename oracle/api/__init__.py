@@ -1,10 +1,25 @@
 """
 REST API for Multi-Agent Oracle.
+
+The server module (FastAPI, uvicorn, the oracle core) is imported lazily on
+first attribute access, so importing ``oracle.api`` stays cheap for callers
+that never start the HTTP server.
 """
 
-from oracle.api.server import OracleAPI, create_app
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from oracle.api.server import OracleAPI, create_app
 
 __all__ = [
     "create_app",
     "OracleAPI",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from oracle.api import server
+
+        return getattr(server, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,30 +6,46 @@ Provides HTTP endpoints for requesting oracle resolutions.
 API Version: v1 (Enhanced with full verification support)
 """
 
+import asyncio
+import functools
+import hmac
 import ipaddress
-import os
-import uuid
+import secrets
+import time
+from collections.abc import Awaitable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from enum import StrEnum
+from typing import Any, Literal, TypeVar
 from urllib.parse import urlparse
 
-# Load environment variables early
-from dotenv import load_dotenv
-
-load_dotenv()
-
+import httpx
+import orjson
 import structlog
 import uvicorn
-from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Security
+from cachetools import LRUCache, TLRUCache
+from dotenv import load_dotenv
+from fastapi import Depends, FastAPI, HTTPException, Security
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import APIKeyHeader
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from starlette.background import BackgroundTask
 
 from oracle.core import MultiAgentOracle, OracleConfig
+from oracle.storage import (
+    IPFSStorage,
+    OracleResearchDataBuilder,
+    calculate_sha256,
+    to_canonical_bytes,
+)
 
 logger = structlog.get_logger()
 
+T = TypeVar("T")
+
 
 # ============================================================================
 # Request/Response Models (v1 - Full Featured)
@@ -101,7 +117,10 @@ class ResultResponse(BaseModel):
     """
     Oracle result response with full verification data.
 
-    Includes all data needed for on-chain verification.
+    Includes all data needed for on-chain verification. Fields that are
+    None are omitted from API responses, so in-flight (processing) results
+    only carry request_id, market_id, status and ipfs_mock; failed results
+    add error.
     """
 
     request_id: str
@@ -157,7 +176,8 @@ class MultiOutcomeResultResponse(BaseModel):
     """
     Oracle result response for multi-outcome markets.
 
-    Returns the winning outcome index instead of YES/NO.
+    Returns the winning outcome index instead of YES/NO. Fields that are
+    None are omitted from API responses.
     """
 
     request_id: str
@@ -259,7 +279,7 @@ class GetConfigResponse(BaseModel):
     success: bool
     cid: str
     config: dict | None = None
-    verified: bool = False
+    verified: bool | None = False  # None when no expected_hash was given
     expected_hash: str | None = None
     actual_hash: str | None = None
     error: str | None = None
@@ -270,6 +290,27 @@ class GetConfigResponse(BaseModel):
 # ============================================================================
 
 
+class RequestStatus(StrEnum):
+    """Lifecycle of a resolution request in the result store."""
+
+    NOT_FOUND = "not_found"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass(slots=True)
+class _RequestState:
+    """Everything the in-memory store tracks for one request."""
+
+    status: RequestStatus
+    updated_at: float
+    result: ResultResponse | MultiOutcomeResultResponse | None = None
+    error: str | None = None
+    # Set when a processing request completes or fails; see ResultStore.wait()
+    done: asyncio.Event | None = None
+
+
 class ResultStore:
     """In-memory result store with TTL-based eviction."""
 
@@ -277,122 +318,410 @@ class ResultStore:
     TTL_SECONDS = 3600
 
     def __init__(self):
-        self._results: dict[str, ResultResponse | MultiOutcomeResultResponse] = {}
-        self._status: dict[str, str] = {}
-        self._timestamps: dict[str, float] = {}
+        self._states: dict[str, _RequestState] = {}
 
     def _evict_stale(self):
-        import time
         now = time.time()
         stale_keys = [
-            k for k, ts in self._timestamps.items()
-            if now - ts > self.TTL_SECONDS
+            k for k, state in self._states.items()
+            if now - state.updated_at > self.TTL_SECONDS
         ]
         for k in stale_keys:
-            self._results.pop(k, None)
-            self._status.pop(k, None)
-            self._timestamps.pop(k, None)
-        if len(self._timestamps) > self.MAX_ENTRIES:
-            oldest = sorted(self._timestamps, key=self._timestamps.get)[:len(self._timestamps) - self.MAX_ENTRIES]
-            for k in oldest:
-                self._results.pop(k, None)
-                self._status.pop(k, None)
-                self._timestamps.pop(k, None)
-
-    def set_processing(self, request_id: str):
-        import time
+            del self._states[k]
+        if len(self._states) > self.MAX_ENTRIES:
+            by_age = sorted(self._states, key=lambda k: self._states[k].updated_at)
+            for k in by_age[:len(self._states) - self.MAX_ENTRIES]:
+                del self._states[k]
+
+    async def set_processing(self, request_id: str):
         self._evict_stale()
-        self._status[request_id] = "processing"
-        self._timestamps[request_id] = time.time()
+        self._states[request_id] = _RequestState(
+            status=RequestStatus.PROCESSING, updated_at=time.time(), done=asyncio.Event()
+        )
 
-    def set_completed(self, request_id: str, result: ResultResponse):
-        import time
-        self._results[request_id] = result
-        self._status[request_id] = "completed"
-        self._timestamps[request_id] = time.time()
+    async def set_completed(
+        self, request_id: str, result: ResultResponse | MultiOutcomeResultResponse
+    ):
+        self._finish(request_id, RequestStatus.COMPLETED, result=result)
 
-    def set_failed(self, request_id: str, error: str):
-        import time
-        self._status[request_id] = f"failed: {error}"
-        self._timestamps[request_id] = time.time()
+    async def set_failed(self, request_id: str, error: str):
+        self._finish(request_id, RequestStatus.FAILED, error=error)
 
-    def get(self, request_id: str) -> tuple[str, ResultResponse | MultiOutcomeResultResponse | None]:
-        status = self._status.get(request_id, "not_found")
-        result = self._results.get(request_id)
-        return status, result
+    def _finish(
+        self,
+        request_id: str,
+        status: RequestStatus,
+        result: ResultResponse | MultiOutcomeResultResponse | None = None,
+        error: str | None = None,
+    ):
+        state = self._states.get(request_id)
+        if state is None:
+            self._states[request_id] = _RequestState(
+                status=status, updated_at=time.time(), result=result, error=error
+            )
+            return
 
+        state.status = status
+        state.result = result
+        state.error = error
+        state.updated_at = time.time()
+        # Waiters hold their own reference, so the event can be dropped here
+        if state.done is not None:
+            state.done.set()
+            state.done = None
 
-# ============================================================================
-# API Application
-# ============================================================================
+    async def wait(self, request_id: str, timeout: float) -> bool:
+        """
+        Wait up to timeout seconds for a processing request to finish.
+
+        Returns False if it is still processing when the timeout expires,
+        True otherwise (including for unknown requests).
+        """
+        state = self._states.get(request_id)
+        if state is None or state.done is None:
+            return True
+        try:
+            await asyncio.wait_for(state.done.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
 
+    async def get(
+        self, request_id: str
+    ) -> tuple[RequestStatus, ResultResponse | MultiOutcomeResultResponse | None, str | None]:
+        """Return (status, result, error) for a request."""
+        state = self._states.get(request_id)
+        if state is None:
+            return RequestStatus.NOT_FOUND, None, None
+        return state.status, state.result, state.error
 
-class _BoundedRequestStore:
-    """Dict-like store with TTL eviction and max size for request metadata."""
+    async def close(self):
+        pass
 
-    MAX_ENTRIES = 1000
-    TTL_SECONDS = 86400  # 24 hours
 
-    def __init__(self):
-        self._data: dict[str, ResolutionRequest] = {}
-        self._timestamps: dict[str, float] = {}
+class RedisResultStore:
+    """
+    Redis-backed result store shared by all API worker processes.
 
-    def _evict(self):
-        import time
-        now = time.time()
-        stale = [k for k, ts in self._timestamps.items() if now - ts > self.TTL_SECONDS]
-        for k in stale:
-            self._data.pop(k, None)
-            self._timestamps.pop(k, None)
-        if len(self._data) > self.MAX_ENTRIES:
-            oldest = sorted(self._timestamps, key=self._timestamps.get)[: len(self._data) - self.MAX_ENTRIES]
-            for k in oldest:
-                self._data.pop(k, None)
-                self._timestamps.pop(k, None)
+    Enabled by ORACLE_STORE=redis, or by setting REDIS_URL when ORACLE_STORE
+    is unset (requires the ``redis`` extra). Status, result and error live
+    under ``oracle:status:{id}`` / ``oracle:result:{id}`` / ``oracle:error:{id}``
+    and expire after TTL_SECONDS, so Redis bounds memory instead of the API.
+    """
+
+    TTL_SECONDS = ResultStore.TTL_SECONDS
+    KEY_PREFIX = "oracle"
 
-    def __setitem__(self, key: str, value: ResolutionRequest):
-        import time
-        self._evict()
-        self._data[key] = value
-        self._timestamps[key] = time.time()
+    _RESULT_MODELS: dict[str, type[BaseModel]] = {
+        "ResultResponse": ResultResponse,
+        "MultiOutcomeResultResponse": MultiOutcomeResultResponse,
+    }
 
-    def __getitem__(self, key: str):
-        return self._data[key]
+    def __init__(self, url: str):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError(
+                "REDIS_URL is set but the redis package is not installed. "
+                "Install with: pip install 'multi-agent-oracle[redis]'"
+            ) from e
+
+        self._redis = redis.Redis.from_url(url)
+
+    def _keys(self, request_id: str) -> tuple[str, str, str]:
+        return (
+            f"{self.KEY_PREFIX}:status:{request_id}",
+            f"{self.KEY_PREFIX}:result:{request_id}",
+            f"{self.KEY_PREFIX}:error:{request_id}",
+        )
 
-    def get(self, key: str, default=None):
-        return self._data.get(key, default)
+    def _done_channel(self, request_id: str) -> str:
+        return f"{self.KEY_PREFIX}:done:{request_id}"
+
+    async def set_processing(self, request_id: str):
+        status_key, _, _ = self._keys(request_id)
+        await self._redis.setex(status_key, self.TTL_SECONDS, RequestStatus.PROCESSING)
+
+    async def set_completed(
+        self, request_id: str, result: ResultResponse | MultiOutcomeResultResponse
+    ):
+        status_key, result_key, _ = self._keys(request_id)
+        payload = orjson.dumps(
+            {"type": type(result).__name__, "data": result.model_dump(mode="json")}
+        )
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.setex(status_key, self.TTL_SECONDS, RequestStatus.COMPLETED)
+            pipe.setex(result_key, self.TTL_SECONDS, payload)
+            pipe.publish(self._done_channel(request_id), "completed")
+            await pipe.execute()
+
+    async def set_failed(self, request_id: str, error: str):
+        status_key, _, error_key = self._keys(request_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.setex(status_key, self.TTL_SECONDS, RequestStatus.FAILED)
+            pipe.setex(error_key, self.TTL_SECONDS, error)
+            pipe.publish(self._done_channel(request_id), "failed")
+            await pipe.execute()
+
+    async def wait(self, request_id: str, timeout: float) -> bool:
+        """
+        Wait up to timeout seconds for a processing request to finish.
+
+        The request may be running on another worker, so completion is
+        signalled over Redis pub/sub. Subscribing before reading the status
+        means a completion cannot slip in between the two.
+        """
+        status_key, _, _ = self._keys(request_id)
+        async with self._redis.pubsub() as pubsub:
+            await pubsub.subscribe(self._done_channel(request_id))
+            if await self._redis.get(status_key) != b"processing":
+                return True
+
+            async def _done():
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        return
+
+            try:
+                await asyncio.wait_for(_done(), timeout)
+            except TimeoutError:
+                return False
+            return True
+
+    async def get(
+        self, request_id: str
+    ) -> tuple[RequestStatus, ResultResponse | MultiOutcomeResultResponse | None, str | None]:
+        """Return (status, result, error) for a request."""
+        status, payload, error = await self._redis.mget(*self._keys(request_id))
+        if status is None:
+            return RequestStatus.NOT_FOUND, None, None
+
+        result = None
+        if payload is not None:
+            entry = orjson.loads(payload)
+            result = self._RESULT_MODELS[entry["type"]].model_validate(entry["data"])
+        return self._parse_status(status.decode(), error.decode() if error else None, result)
+
+    @staticmethod
+    def _parse_status(
+        value: str,
+        error: str | None,
+        result: ResultResponse | MultiOutcomeResultResponse | None,
+    ) -> tuple[RequestStatus, ResultResponse | MultiOutcomeResultResponse | None, str | None]:
+        """Decode a stored status, including values written by older workers."""
+        try:
+            return RequestStatus(value), result, error
+        except ValueError:
+            pass
+        # Older workers stored failures as "failed: <error>" with no error key
+        prefix = f"{RequestStatus.FAILED}: "
+        if value.startswith(prefix):
+            return RequestStatus.FAILED, result, error or value.removeprefix(prefix)
+        logger.warning("Unrecognized stored request status", status=value)
+        return RequestStatus.FAILED, result, error or f"Unrecognized status: {value}"
+
+    async def close(self):
+        await self._redis.aclose()
+
+
+# ============================================================================
+# API Application
+# ============================================================================
 
 
 class OracleAPI:
     """Oracle API application."""
 
+    WEBHOOK_QUEUE_SIZE = 1000
+
     def __init__(self):
         self.oracle: MultiAgentOracle | None = None
-        self.result_store = ResultStore()
-        self.requests = _BoundedRequestStore()
+        self.ipfs: IPFSStorage | None = None
+        self.http: httpx.AsyncClient | None = None
+        self.result_store: ResultStore | RedisResultStore = ResultStore()
+        # Pending (callback_url, encoded payload) pairs, drained by _webhook_workers
+        self.webhooks: asyncio.Queue[tuple[str, bytes]] | None = None
+        self._webhook_workers: list[asyncio.Task[None]] = []
+        # Caps concurrent resolution runs; set from MAX_CONCURRENT_RESOLUTIONS
+        self.resolution_slots: asyncio.Semaphore | None = None
 
     async def initialize(self):
         """Initialize the oracle."""
-        num_agents = int(os.getenv("MIN_AGENTS", "3"))
+        settings = get_settings()
+        num_agents = settings.min_agents
+        self.resolution_slots = asyncio.Semaphore(settings.max_concurrent_resolutions)
+
+        if settings.result_store_backend == "redis":
+            if not settings.redis_url:
+                raise RuntimeError("ORACLE_STORE=redis requires REDIS_URL")
+            self.result_store = RedisResultStore(settings.redis_url)
+            logger.info("Using Redis result store")
 
         self.oracle = MultiAgentOracle(
             config=OracleConfig(
                 num_agents=num_agents,
                 enable_ipfs=True,
-            )
+            ),
+            ipfs_storage=self.get_ipfs(),
         )
         logger.info("Oracle API initialized", num_agents=num_agents)
 
+    def get_ipfs(self) -> IPFSStorage:
+        """Get the shared IPFS client, creating it on first use."""
+        if self.ipfs is None:
+            self.ipfs = IPFSStorage()
+        return self.ipfs
+
+    def get_http(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client for outbound calls (webhooks)."""
+        if self.http is None:
+            # Webhooks are sparse (one per resolution), so keep idle connections
+            # around longer than httpx's 5s default to actually get reuse.
+            self.http = httpx.AsyncClient(
+                timeout=10,
+                limits=httpx.Limits(
+                    max_connections=100, max_keepalive_connections=50, keepalive_expiry=30
+                ),
+            )
+        return self.http
+
+    def enqueue_webhook(self, url: str, result: ResultResponse) -> None:
+        """Queue a webhook for delivery by the background webhook workers."""
+        if self.webhooks is None:
+            count = get_settings().webhook_workers
+            self.webhooks = asyncio.Queue(maxsize=self.WEBHOOK_QUEUE_SIZE)
+            self._webhook_workers = [
+                asyncio.create_task(self._webhook_worker(self.webhooks)) for _ in range(count)
+            ]
+
+        try:
+            self.webhooks.put_nowait((url, orjson.dumps(result.model_dump())))
+        except asyncio.QueueFull:
+            logger.error(f"Webhook queue full, dropping webhook to {url}")
+
+    async def _webhook_worker(self, queue: asyncio.Queue[tuple[str, bytes]]) -> None:
+        while True:
+            url, body = await queue.get()
+            try:
+                await _send_webhook(url, body)
+            finally:
+                queue.task_done()
+
     async def shutdown(self):
         """Shutdown the oracle."""
+        if self.webhooks is not None:
+            try:
+                await asyncio.wait_for(self.webhooks.join(), timeout=10)
+            except TimeoutError:
+                logger.warning(f"Dropping {self.webhooks.qsize()} undelivered webhooks")
+            for worker in self._webhook_workers:
+                worker.cancel()
+            await asyncio.gather(*self._webhook_workers, return_exceptions=True)
         if self.oracle:
             await self.oracle.close()
+        elif self.ipfs:
+            await self.ipfs.close()
+        if self.http:
+            await self.http.aclose()
+        await self.result_store.close()
         logger.info("Oracle API shutdown")
 
 
 # Global API instance
 api_instance = OracleAPI()
 
+# Oracle configs fetched from IPFS, keyed by CID: (config, sha256 of canonical JSON).
+# The hash is filled in on first verification. CIDs are content-addressed, so
+# cached entries never go stale.
+_config_cache: LRUCache[str, tuple[dict, str | None]] = LRUCache(maxsize=1024)
+
+
+@functools.cache
+def _load_env() -> None:
+    """Load .env into the process environment, at most once per process."""
+    load_dotenv()
+
+
+class Settings(BaseSettings):
+    """
+    Server settings read from the environment.
+
+    Built once per process by get_settings(), so request handlers never parse
+    environment variables themselves.
+    """
+
+    model_config = SettingsConfigDict(extra="ignore", populate_by_name=True)
+
+    api_host: str = "0.0.0.0"
+    api_port: int = 8989
+    # WEB_CONCURRENCY is the variable most process managers/PaaS set
+    api_workers: int = Field(1, validation_alias=AliasChoices("API_WORKERS", "WEB_CONCURRENCY"))
+    min_agents: int = 3
+    cors_origins: str = "http://localhost:3000,http://localhost:8082"
+    oracle_api_key: str | None = None
+    oracle_store: Literal["memory", "redis"] | None = None
+    redis_url: str | None = None
+    webhook_workers: int = Field(4, ge=1)
+    max_concurrent_resolutions: int = Field(10, ge=1)
+    resolve_cache_ttl: float = 0.0
+    consensus_threshold: float = 0.66
+    multi_outcome_consensus_threshold: float = 0.80
+
+    @field_validator("oracle_store", mode="before")
+    @classmethod
+    def _normalize_oracle_store(cls, value: object) -> object:
+        """Accept ORACLE_STORE case-insensitively and with stray whitespace."""
+        if isinstance(value, str):
+            return value.strip().lower() or None
+        return value
+
+    @property
+    def cors_origin_list(self) -> list[str]:
+        """Explicitly allowed CORS origins, deduplicated in configured order."""
+        return list(dict.fromkeys(o.strip() for o in self.cors_origins.split(",") if o.strip()))
+
+    @property
+    def result_store_backend(self) -> str:
+        """Result store backend ("redis" by default if REDIS_URL is set)."""
+        if self.oracle_store:
+            return self.oracle_store
+        return "redis" if self.redis_url else "memory"
+
+
+@functools.cache
+def get_settings() -> Settings:
+    """Load .env and parse the server settings, at most once per process."""
+    _load_env()
+    return Settings()
+
+
+# Upper bound for ?wait= long-polls on result endpoints, kept below common
+# proxy idle timeouts.
+MAX_RESULT_WAIT_SECONDS = 60.0
+
+# (epoch second, RFC 3339 string) of the last health check timestamp
+_health_timestamp: tuple[int, str] = (0, "")
+
+
+def _health_check_timestamp() -> str:
+    """Current UTC time for /health, formatted at most once per second."""
+    global _health_timestamp
+    now = int(time.time())
+    if _health_timestamp[0] != now:
+        _health_timestamp = (now, datetime.fromtimestamp(now, tz=UTC).isoformat())
+    return _health_timestamp[1]
+
+
+def _result_json(result: ResultResponse | MultiOutcomeResultResponse) -> ORJSONResponse:
+    """
+    Serialize a result model directly, dropping None fields.
+
+    Returning a Response skips FastAPI's response_model pass, which would
+    re-validate an already-valid model; the decorators keep response_model
+    for the OpenAPI schema.
+    """
+    return ORJSONResponse(result.model_dump(exclude_none=True))
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -404,18 +733,20 @@ async def lifespan(app: FastAPI):
 
 def create_app() -> FastAPI:
     """Create the FastAPI application."""
+    settings = get_settings()
 
     app = FastAPI(
         title="1024 Multi-Agent Deep Research Oracle",
         description="AI-powered decentralized oracle for prediction markets",
         version="1.0.0",
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
     # API Key authentication
     # Set ORACLE_API_KEY env var to enable. If not set, authentication is disabled.
     api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
-    oracle_api_key = os.getenv("ORACLE_API_KEY")
+    oracle_api_key = settings.oracle_api_key
 
     if not oracle_api_key:
         logger.warning(
@@ -431,11 +762,9 @@ def create_app() -> FastAPI:
             raise HTTPException(status_code=403, detail="Invalid or missing API key")
 
     # CORS — allow all 1024 platform origins + Vercel preview deployments
-    cors_origins_str = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:8082")
-    cors_origins = [o.strip() for o in cors_origins_str.split(",") if o.strip()]
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=cors_origins,
+        allow_origins=settings.cors_origin_list,
         allow_origin_regex=r"https://(.*\.)?(1024ex\.com|1024chain\.com|1024.*\.vercel\.app)",
         allow_credentials=True,
         allow_methods=["GET", "POST", "OPTIONS"],
@@ -455,13 +784,18 @@ def create_app() -> FastAPI:
         - agents_configured: Number of agents configured
         - ipfs_enabled: Whether IPFS storage is enabled
         """
+        # Probed constantly by load balancers: return the HealthResponse-shaped
+        # body directly rather than building and re-validating a model per call.
+        # response_model is kept for the OpenAPI schema.
         oracle = api_instance.oracle
-        return HealthResponse(
-            status="healthy" if oracle else "initializing",
-            version="1.0.0",
-            timestamp=datetime.now(UTC).isoformat(),
-            agents_configured=oracle.config.num_agents if oracle else None,
-            ipfs_enabled=oracle.config.enable_ipfs if oracle else None,
+        return ORJSONResponse(
+            {
+                "status": "healthy" if oracle else "initializing",
+                "version": "1.0.0",
+                "timestamp": _health_check_timestamp(),
+                "agents_configured": oracle.config.num_agents if oracle else None,
+                "ipfs_enabled": oracle.config.enable_ipfs if oracle else None,
+            }
         )
 
     # ========================================================================
@@ -485,7 +819,7 @@ def create_app() -> FastAPI:
         5. Returns CID and hash for on-chain storage
         """
         from oracle.agents.strategies import StrategyFactory
-        from oracle.storage import IPFSStorage, OracleConfigData
+        from oracle.storage import OracleConfigData
 
         try:
             # Build agent strategies
@@ -495,11 +829,9 @@ def create_app() -> FastAPI:
 
             strategies = request.agent_strategies
             if not strategies:
-                strategies = [
-                    p.value for p in StrategyFactory.get_recommended_profiles(agent_count)
-                ]
+                strategies = StrategyFactory.get_recommended_strategy_names(agent_count)
 
-            consensus_threshold = float(os.getenv("CONSENSUS_THRESHOLD", "0.66"))
+            consensus_threshold = get_settings().consensus_threshold
             if request.llm_config and "consensus_threshold" in request.llm_config:
                 consensus_threshold = request.llm_config.get(
                     "consensus_threshold", consensus_threshold
@@ -530,7 +862,7 @@ def create_app() -> FastAPI:
             canonical_json, config_hash = config.get_hash_data()
 
             # Upload to IPFS
-            ipfs = IPFSStorage()
+            ipfs = api_instance.get_ipfs()
             cid = await ipfs.store_config(config, f"oracle-config-{request.market_id}.json")
 
             gateway_url = ipfs.get_gateway_url(cid) if cid else None
@@ -568,34 +900,43 @@ def create_app() -> FastAPI:
             cid: IPFS CID of the config
             expected_hash: Optional SHA256 hash to verify against
         """
-        from oracle.storage import IPFSStorage, calculate_sha256, to_canonical_json
-
         try:
-            # Fetch from IPFS
-            ipfs = IPFSStorage()
-            config_data = await ipfs.fetch(cid)
-
-            if config_data is None:
+            cached = _config_cache.get(cid)
+            if cached is not None:
+                config_data, actual_hash = cached
+            else:
+                # Fetch from IPFS
+                config_data = await api_instance.get_ipfs().fetch(cid)
+
+                if config_data is None:
+                    return GetConfigResponse(
+                        success=False,
+                        cid=cid,
+                        error="Config not found on IPFS",
+                    )
+
+                actual_hash = None
+                _config_cache[cid] = (config_data, actual_hash)
+
+            # Plain fetches skip canonicalization and hashing entirely
+            if expected_hash is None:
                 return GetConfigResponse(
-                    success=False,
+                    success=True,
                     cid=cid,
-                    error="Config not found on IPFS",
+                    config=config_data,
+                    verified=None,
+                    actual_hash=actual_hash,
                 )
 
-            # Calculate hash
-            canonical_json = to_canonical_json(config_data)
-            actual_hash = calculate_sha256(canonical_json)
-
-            # Verify if expected hash provided
-            verified = True
-            if expected_hash:
-                verified = actual_hash == expected_hash
+            if actual_hash is None:
+                actual_hash = calculate_sha256(to_canonical_bytes(config_data))
+                _config_cache[cid] = (config_data, actual_hash)
 
             return GetConfigResponse(
                 success=True,
                 cid=cid,
                 config=config_data,
-                verified=verified,
+                verified=hmac.compare_digest(actual_hash.encode(), expected_hash.encode()),
                 expected_hash=expected_hash,
                 actual_hash=actual_hash,
             )
@@ -620,7 +961,7 @@ def create_app() -> FastAPI:
 
         return {
             "strategies": StrategyFactory.list_all_profiles(),
-            "recommended_5_agents": [p.value for p in StrategyFactory.get_recommended_profiles(5)],
+            "recommended_5_agents": StrategyFactory.get_recommended_strategy_names(5),
         }
 
     # ========================================================================
@@ -630,10 +971,7 @@ def create_app() -> FastAPI:
     @app.post(
         "/api/v1/resolve", response_model=ResolutionResponse, dependencies=[Depends(verify_api_key)]
     )
-    async def request_resolution(
-        request: ResolutionRequest,
-        background_tasks: BackgroundTasks,
-    ):
+    async def request_resolution(request: ResolutionRequest):
         """
         Request oracle resolution for a prediction market.
 
@@ -649,29 +987,24 @@ def create_app() -> FastAPI:
         if not api_instance.oracle:
             raise HTTPException(status_code=503, detail="Oracle not initialized")
 
-        request_id = f"req_{uuid.uuid4().hex[:12]}"
+        request_id = f"req_{secrets.token_hex(6)}"
 
         # Mark as processing
-        api_instance.result_store.set_processing(request_id)
+        await api_instance.result_store.set_processing(request_id)
 
-        # Store request info
-        api_instance.requests[request_id] = request
-
-        # Run resolution in background
-        background_tasks.add_task(
-            _run_resolution,
-            request_id,
-            request,
-        )
-
-        return ResolutionResponse(
-            request_id=request_id,
-            status="processing",
-            estimated_time_seconds=180,
+        # Run resolution after the response is sent. A single BackgroundTask on
+        # the response skips the BackgroundTasks dependency and its task list.
+        return ORJSONResponse(
+            {"request_id": request_id, "status": "processing", "estimated_time_seconds": 180},
+            background=BackgroundTask(_run_resolution, request_id, request),
         )
 
-    @app.get("/api/v1/result/{request_id}", response_model=ResultResponse)
-    async def get_result(request_id: str):
+    @app.get(
+        "/api/v1/result/{request_id}",
+        response_model=ResultResponse | MultiOutcomeResultResponse,
+        response_model_exclude_none=True,
+    )
+    async def get_result(request_id: str, wait: float = 0):
         """
         Get the result of a resolution request.
 
@@ -680,35 +1013,38 @@ def create_app() -> FastAPI:
         - Source statistics (tier1/tier2 sources)
         - IPFS CIDs and hashes for on-chain verification
         - Manual review flags if applicable
+
+        Args:
+            wait: Seconds to long-poll while the request is processing
+                (capped at MAX_RESULT_WAIT_SECONDS); 0 returns immediately.
         """
-        status, result = api_instance.result_store.get(request_id)
+        status, result, error = await api_instance.result_store.get(request_id)
+
+        if status is RequestStatus.PROCESSING and wait > 0:
+            timeout = min(wait, MAX_RESULT_WAIT_SECONDS)
+            if await api_instance.result_store.wait(request_id, timeout):
+                status, result, error = await api_instance.result_store.get(request_id)
 
-        if status == "not_found":
+        if status is RequestStatus.NOT_FOUND:
             raise HTTPException(status_code=404, detail="Request not found")
 
-        if status == "processing":
-            return ResultResponse(
-                request_id=request_id,
-                market_id=0,
-                status="processing",
-            )
+        if status is RequestStatus.PROCESSING:
+            return _result_json(ResultResponse(request_id=request_id, market_id=0, status=status))
 
-        if status.startswith("failed"):
-            return ResultResponse(
-                request_id=request_id,
-                market_id=0,
-                status="failed",
-                error=status.replace("failed: ", ""),
+        if status is RequestStatus.FAILED:
+            return _result_json(
+                ResultResponse(request_id=request_id, market_id=0, status=status, error=error)
             )
 
         if result:
-            return result
+            return _result_json(result)
 
         raise HTTPException(status_code=500, detail="Unknown error")
 
     @app.post(
         "/api/v1/resolve/sync",
         response_model=ResultResponse,
+        response_model_exclude_none=True,
         dependencies=[Depends(verify_api_key)],
     )
     async def resolve_sync(request: ResolutionRequest):
@@ -724,7 +1060,7 @@ def create_app() -> FastAPI:
             raise HTTPException(status_code=503, detail="Oracle not initialized")
 
         try:
-            request_id = f"req_{uuid.uuid4().hex[:12]}"
+            request_id = f"req_{secrets.token_hex(6)}"
 
             # Run resolution
             result = await _execute_resolution(
@@ -732,7 +1068,7 @@ def create_app() -> FastAPI:
                 request,
             )
 
-            return result
+            return _result_json(result)
 
         except Exception as e:
             logger.error(f"Resolution failed: {e}")
@@ -745,6 +1081,7 @@ def create_app() -> FastAPI:
     @app.post(
         "/api/v1/resolve-multi/sync",
         response_model=MultiOutcomeResultResponse,
+        response_model_exclude_none=True,
         dependencies=[Depends(verify_api_key)],
     )
     async def resolve_multi_sync(request: MultiOutcomeResolutionRequest):
@@ -765,14 +1102,11 @@ def create_app() -> FastAPI:
             )
 
         try:
-            request_id = f"req_{uuid.uuid4().hex[:12]}"
+            request_id = f"req_{secrets.token_hex(6)}"
 
-            result = await _execute_multi_outcome_resolution(
-                request_id,
-                request,
-            )
+            result = await _limited(_execute_multi_outcome_resolution(request_id, request))
 
-            return result
+            return _result_json(result)
 
         except Exception as e:
             logger.error(f"Multi-outcome resolution failed: {e}")
@@ -802,8 +1136,8 @@ def create_app() -> FastAPI:
             import json as _json
             import time as _time
 
-            request_id = f"req_{uuid.uuid4().hex[:12]}"
-            api_instance.result_store.set_processing(request_id)
+            request_id = f"req_{secrets.token_hex(6)}"
+            await api_instance.result_store.set_processing(request_id)
 
             last_heartbeat = _time.monotonic()
             heartbeat_interval = 15.0
@@ -832,13 +1166,15 @@ def create_app() -> FastAPI:
                             final_response = await _build_result_response_from_oracle_result(
                                 request_id, request, oracle_result
                             )
-                            api_instance.result_store.set_completed(request_id, final_response)
+                            await api_instance.result_store.set_completed(
+                                request_id, final_response
+                            )
                         except Exception as e:
                             logger.error(f"Failed to build final response: {e}")
-                            api_instance.result_store.set_failed(request_id, str(e))
+                            await api_instance.result_store.set_failed(request_id, str(e))
 
                     if event_type == "resolution:error":
-                        api_instance.result_store.set_failed(
+                        await api_instance.result_store.set_failed(
                             request_id, event.get("error", "Unknown error")
                         )
 
@@ -846,7 +1182,7 @@ def create_app() -> FastAPI:
                 logger.error(f"SSE stream error: {e}")
                 error_data = _json.dumps({"event_type": "resolution:error", "error": str(e)})
                 yield f"event: resolution:error\ndata: {error_data}\n\n"
-                api_instance.result_store.set_failed(request_id, str(e))
+                await api_instance.result_store.set_failed(request_id, str(e))
 
         return StreamingResponse(
             _generate(),
@@ -881,14 +1217,14 @@ def create_app() -> FastAPI:
             import json as _json
             import time as _time
 
-            request_id = f"req_{uuid.uuid4().hex[:12]}"
-            api_instance.result_store.set_processing(request_id)
+            request_id = f"req_{secrets.token_hex(6)}"
+            await api_instance.result_store.set_processing(request_id)
 
             last_heartbeat = _time.monotonic()
             heartbeat_interval = 15.0
 
-            threshold = request.consensus_threshold or float(
-                os.getenv("MULTI_OUTCOME_CONSENSUS_THRESHOLD", "0.80")
+            threshold = (
+                request.consensus_threshold or get_settings().multi_outcome_consensus_threshold
             )
 
             try:
@@ -917,13 +1253,15 @@ def create_app() -> FastAPI:
                             final_response = await _build_result_response_from_oracle_result(
                                 request_id, request, oracle_result
                             )
-                            api_instance.result_store.set_completed(request_id, final_response)
+                            await api_instance.result_store.set_completed(
+                                request_id, final_response
+                            )
                         except Exception as e:
                             logger.error(f"Failed to build multi-outcome final response: {e}")
-                            api_instance.result_store.set_failed(request_id, str(e))
+                            await api_instance.result_store.set_failed(request_id, str(e))
 
                     if event_type == "resolution:error":
-                        api_instance.result_store.set_failed(
+                        await api_instance.result_store.set_failed(
                             request_id, event.get("error", "Unknown error")
                         )
 
@@ -931,7 +1269,7 @@ def create_app() -> FastAPI:
                 logger.error(f"Multi-outcome SSE stream error: {e}")
                 error_data = _json.dumps({"event_type": "resolution:error", "error": str(e)})
                 yield f"event: resolution:error\ndata: {error_data}\n\n"
-                api_instance.result_store.set_failed(request_id, str(e))
+                await api_instance.result_store.set_failed(request_id, str(e))
 
         return StreamingResponse(
             _generate(),
@@ -955,7 +1293,6 @@ async def _build_result_response_from_oracle_result(
     from oracle.agents import StrategyFactory
     from oracle.consensus import StrictConsensusConfig, StrictConsensusEngine
     from oracle.models import AgentResult, ConsensusResult, MultiOutcomeOracleResult, Outcome
-    from oracle.storage import OracleResearchDataBuilder
 
     research_started_at = result.research_started_at
     research_completed_at = result.research_completed_at
@@ -1003,37 +1340,34 @@ async def _build_result_response_from_oracle_result(
     builder.set_merged_sources(result.merged_sources)
 
     agent_count = request.agent_count or 5
-    strategies = [p.value for p in StrategyFactory.get_recommended_profiles(agent_count)]
+    strategies = StrategyFactory.get_recommended_strategy_names(agent_count)
 
     if is_multi:
-        threshold = request.consensus_threshold or float(os.getenv("MULTI_OUTCOME_CONSENSUS_THRESHOLD", "0.80"))
+        threshold = (
+            request.consensus_threshold or get_settings().multi_outcome_consensus_threshold
+        )
     else:
-        threshold = request.consensus_threshold or float(os.getenv("CONSENSUS_THRESHOLD", "0.66"))
+        threshold = request.consensus_threshold or get_settings().consensus_threshold
 
-    oracle_config = builder.build_config(
+    builder.build_config(
         agent_count=agent_count,
         agent_strategies=strategies,
         consensus_threshold=threshold,
     )
-    _, config_hash = oracle_config.get_hash_data()
-
-    research_data = builder.build()
-    _, research_hash = research_data.get_hash_data()
+    config_hash = builder.oracle_config_hash
 
     strict_engine = StrictConsensusEngine(
         config=StrictConsensusConfig(threshold=threshold)
     )
     strict_consensus, provable_data = strict_engine.calculate_strict(binary_agent_results)
+    disagreement = provable_data.disagreement
+
+    # Build, serialize and hash the research data off the event loop
+    research_hash = await asyncio.to_thread(_research_data_hash, builder)
 
     weighted_ratio = result.consensus.weighted_ratio
 
-    ipfs_mock = (
-        result.ipfs_cid is None
-        or not result.ipfs_cid
-        or os.path.exists(
-            os.path.join(os.getcwd(), ".ipfs_mock", f"{result.ipfs_cid}.json")
-        )
-    )
+    ipfs_mock = _is_mock_cid(result.ipfs_cid)
 
     shared_kwargs = dict(
         request_id=request_id,
@@ -1043,9 +1377,7 @@ async def _build_result_response_from_oracle_result(
         agreement_ratio=result.consensus.agreement_ratio,
         weighted_ratio=weighted_ratio,
         consensus_reached=result.consensus.reached,
-        agent_count=len(result.agent_results),
-        valid_agent_count=sum(1 for r in result.agent_results if r.is_valid),
-        total_sources=sum(len(r.sources) for r in result.agent_results),
+        **_agent_stats(result.agent_results),
         unique_sources=len(result.merged_sources),
         tier1_sources=provable_data.verification.tier1_sources,
         tier2_sources=provable_data.verification.tier2_sources,
@@ -1057,24 +1389,21 @@ async def _build_result_response_from_oracle_result(
         verification_issues=provable_data.verification.issues,
         requires_manual_review=(
             strict_consensus.requires_human_review
-            or (provable_data.disagreement and provable_data.disagreement.requires_manual_review)
-        ),
-        review_reason=(
-            provable_data.disagreement.review_reason if provable_data.disagreement else None
+            or bool(disagreement and disagreement.requires_manual_review)
         ),
+        review_reason=disagreement.review_reason if disagreement else None,
         disagreement_analysis=(
-            provable_data.disagreement.model_dump()
-            if provable_data.disagreement and provable_data.disagreement.has_disagreement
-            else None
+            disagreement.model_dump() if disagreement and disagreement.has_disagreement else None
         ),
         research_started_at=research_started_at,
         research_completed_at=research_completed_at,
         ipfs_mock=ipfs_mock,
     )
 
+    # Values come from validated models; skip re-validation
     if is_multi:
         winning = result.consensus.winning_outcome
-        return MultiOutcomeResultResponse(
+        return MultiOutcomeResultResponse.model_construct(
             **shared_kwargs,
             outcome_index=winning.outcome_index if hasattr(winning, "outcome_index") else None,
             outcome_label=winning.outcome_label,
@@ -1082,7 +1411,7 @@ async def _build_result_response_from_oracle_result(
             vote_distribution=result.consensus.vote_distribution,
         )
 
-    return ResultResponse(
+    return ResultResponse.model_construct(
         **shared_kwargs,
         outcome=result.consensus.outcome.value,
     )
@@ -1092,25 +1421,120 @@ async def _run_resolution(request_id: str, request: ResolutionRequest):
     """Background task for resolution."""
     try:
         result = await _execute_resolution(request_id, request)
-        api_instance.result_store.set_completed(request_id, result)
+        await api_instance.result_store.set_completed(request_id, result)
 
         # Send webhook if configured
         if request.callback_url and result.status == "completed":
-            await _send_webhook(request.callback_url, result)
+            api_instance.enqueue_webhook(request.callback_url, result)
 
     except Exception as e:
         logger.error(f"Resolution failed: {e}")
-        api_instance.result_store.set_failed(request_id, str(e))
+        await api_instance.result_store.set_failed(request_id, str(e))
+
+
+def _agent_stats(agent_results: list) -> dict[str, int]:
+    """Count agents, valid agents and total sources in a single pass."""
+    agent_count = valid_agent_count = total_sources = 0
+    for r in agent_results:
+        agent_count += 1
+        valid_agent_count += r.is_valid
+        total_sources += len(r.sources)
+    return {
+        "agent_count": agent_count,
+        "valid_agent_count": valid_agent_count,
+        "total_sources": total_sources,
+    }
+
+
+def _research_data_hash(builder: OracleResearchDataBuilder) -> str:
+    """Build the canonical research data and hash it; called in a worker thread."""
+    return builder.build().calculate_hash()
+
+
+def _is_mock_cid(cid: str | None) -> bool:
+    """Check whether research data is missing or was only stored in local mock IPFS."""
+    if not cid:
+        return True
+    ipfs = api_instance.oracle.ipfs_storage if api_instance.oracle else None
+    return ipfs is not None and ipfs.is_mock_cid(cid)
+
+
+async def _limited(coro: Awaitable[T]) -> T:
+    """
+    Await a resolution once a concurrency slot is free.
+
+    Each run fans out to several agents, LLM calls and IPFS writes, so bursts
+    queue here instead of piling onto downstream services.
+    """
+    if api_instance.resolution_slots is None:
+        return await coro
+    async with api_instance.resolution_slots:
+        return await coro
+
+
+# Resolutions currently running, keyed by _resolution_key()
+_inflight_resolutions: dict[str, asyncio.Task[ResultResponse]] = {}
+
+
+def _resolution_expiry(_key: str, _result: ResultResponse, now: float) -> float:
+    """Cached resolutions expire RESOLVE_CACHE_TTL seconds after they complete."""
+    return now + get_settings().resolve_cache_ttl
+
+
+# Completed results by _resolution_key. Only used when RESOLVE_CACHE_TTL > 0;
+# expired entries are dropped on access and evicted before live ones.
+_resolution_cache: TLRUCache[str, ResultResponse] = TLRUCache(
+    maxsize=1024, ttu=_resolution_expiry, timer=time.monotonic
+)
+
+
+def _resolution_key(request: ResolutionRequest) -> str:
+    """Key identifying requests that resolve to the same result (callback aside)."""
+    return calculate_sha256(to_canonical_bytes(request.model_dump(exclude={"callback_url"})))
 
 
 async def _execute_resolution(
     request_id: str,
     request: ResolutionRequest,
+) -> ResultResponse:
+    """
+    Execute resolution, sharing a single run between identical concurrent requests.
+
+    The run is a separate task, so a caller that goes away (e.g. a dropped
+    sync client) does not cancel it for the others. With RESOLVE_CACHE_TTL set,
+    completed results are also reused for identical requests within the TTL.
+    """
+    key = _resolution_key(request)
+    ttl = get_settings().resolve_cache_ttl
+    cached = _resolution_cache.get(key) if ttl > 0 else None
+    if cached is not None:
+        logger.info(f"Reusing cached resolution for market {request.market_id}")
+        return cached.model_copy(update={"request_id": request_id})
+
+    task = _inflight_resolutions.get(key)
+    if task is None:
+        task = asyncio.create_task(_limited(_execute_verified_resolution(request_id, request)))
+        _inflight_resolutions[key] = task
+        task.add_done_callback(lambda _: _inflight_resolutions.pop(key, None))
+    else:
+        logger.info(f"Joining in-flight resolution for market {request.market_id}")
+
+    result = await asyncio.shield(task)
+    if ttl > 0 and result.status == "completed":
+        _resolution_cache[key] = result
+    if result.request_id != request_id:
+        result = result.model_copy(update={"request_id": request_id})
+    return result
+
+
+async def _execute_verified_resolution(
+    request_id: str,
+    request: ResolutionRequest,
 ) -> ResultResponse:
     """Execute resolution with full verification data."""
     from oracle.agents import StrategyFactory
     from oracle.consensus import StrictConsensusConfig, StrictConsensusEngine
-    from oracle.storage import OracleResearchDataBuilder
+    from oracle.models import OracleResult
 
     if not api_instance.oracle:
         return ResultResponse(
@@ -1120,75 +1544,76 @@ async def _execute_resolution(
             error="Oracle not initialized",
         )
 
-    # Use timezone-aware UTC timestamps for RFC 3339 compliance
-    # (Rust backend parses with DateTime::parse_from_rfc3339 which requires timezone)
-    research_started_at = datetime.now(UTC).isoformat()
-
     try:
-        # Step 1: Run resolution
-        result = await api_instance.oracle.resolve(
+        # Step 1: Run resolution, feeding agent results to the builder as they settle
+        builder = OracleResearchDataBuilder(
+            market_id=request.market_id,
             question=request.question,
             resolution_criteria=request.resolution_criteria,
-            market_id=request.market_id,
             deadline=request.deadline,
         )
 
-        research_completed_at = datetime.now(UTC).isoformat()
-
-        # Step 2: Build research data
-        builder = OracleResearchDataBuilder(
-            market_id=request.market_id,
+        result: OracleResult | None = None
+        async for item in api_instance.oracle.aresolve_stream(
             question=request.question,
             resolution_criteria=request.resolution_criteria,
+            market_id=request.market_id,
             deadline=request.deadline,
-        )
+        ):
+            if isinstance(item, OracleResult):
+                result = item
+            else:
+                builder.add_agent_result(item)
+        if result is None:
+            raise RuntimeError("Resolution stream ended without a result")
+
+        # The oracle stamps timezone-aware UTC times (RFC 3339, as the Rust
+        # backend's DateTime::parse_from_rfc3339 requires) around the run
+        research_started_at = result.research_started_at
+        research_completed_at = result.research_completed_at
         builder.research_started_at = research_started_at
         builder.research_completed_at = research_completed_at
 
-        # Add agent results
-        for agent_result in result.agent_results:
-            builder.add_agent_result(agent_result)
-
         # Set consensus
         builder.set_consensus(result.consensus)
         builder.set_merged_sources(result.merged_sources)
 
         # Build oracle config
         agent_count = request.agent_count or 5
-        strategies = [p.value for p in StrategyFactory.get_recommended_profiles(agent_count)]
+        strategies = StrategyFactory.get_recommended_strategy_names(agent_count)
 
-        oracle_config = builder.build_config(
+        builder.build_config(
             agent_count=agent_count,
             agent_strategies=strategies,
             consensus_threshold=request.consensus_threshold
-            or float(os.getenv("CONSENSUS_THRESHOLD", "0.66")),
+            or get_settings().consensus_threshold,
         )
 
-        # Calculate hashes
-        _, config_hash = oracle_config.get_hash_data()
-
-        # Build research data and compute hash
-        # NOTE: research_data_hash is computed from OracleResearchData (canonical schema),
-        # while research_data_cid points to IPFSResearchData (which may have additional fields
-        # like thinking_process, website_tracking). These are DIFFERENT data structures.
-        # The hash verifies the canonical research summary; the CID provides access to the
-        # full detailed data. This is by design — the hash is for DB integrity verification,
-        # while the CID is for data retrieval.
-        research_data = builder.build()
-        _, research_hash = research_data.get_hash_data()
+        # Config hash was computed by build_config()
+        config_hash = builder.oracle_config_hash
 
         # Step 3: Run strict consensus check
         strict_engine = StrictConsensusEngine(
             config=StrictConsensusConfig(
                 threshold=request.consensus_threshold
-                or float(os.getenv("CONSENSUS_THRESHOLD", "0.66")),
+                or get_settings().consensus_threshold,
             )
         )
 
         strict_consensus, provable_data = strict_engine.calculate_strict(result.agent_results)
+        disagreement = provable_data.disagreement
 
-        # Step 4: Build response
-        return ResultResponse(
+        # Build research data and compute hash, off the event loop
+        # NOTE: research_data_hash is computed from OracleResearchData (canonical schema),
+        # while research_data_cid points to IPFSResearchData (which may have additional fields
+        # like thinking_process, website_tracking). These are DIFFERENT data structures.
+        # The hash verifies the canonical research summary; the CID provides access to the
+        # full detailed data. This is by design — the hash is for DB integrity verification,
+        # while the CID is for data retrieval.
+        research_hash = await asyncio.to_thread(_research_data_hash, builder)
+
+        # Step 4: Build response (values come from validated models; skip re-validation)
+        return ResultResponse.model_construct(
             request_id=request_id,
             market_id=request.market_id,
             status="completed",
@@ -1197,9 +1622,7 @@ async def _execute_resolution(
             agreement_ratio=result.consensus.agreement_ratio,
             weighted_ratio=result.consensus.weighted_ratio,
             consensus_reached=result.consensus.reached,
-            agent_count=len(result.agent_results),
-            valid_agent_count=sum(1 for r in result.agent_results if r.is_valid),
-            total_sources=sum(len(r.sources) for r in result.agent_results),
+            **_agent_stats(result.agent_results),
             unique_sources=len(result.merged_sources),
             tier1_sources=provable_data.verification.tier1_sources,
             tier2_sources=provable_data.verification.tier2_sources,
@@ -1211,28 +1634,17 @@ async def _execute_resolution(
             verification_issues=provable_data.verification.issues,
             requires_manual_review=(
                 strict_consensus.requires_human_review
-                or (
-                    provable_data.disagreement and provable_data.disagreement.requires_manual_review
-                )
-            ),
-            review_reason=(
-                provable_data.disagreement.review_reason if provable_data.disagreement else None
+                or bool(disagreement and disagreement.requires_manual_review)
             ),
+            review_reason=disagreement.review_reason if disagreement else None,
             disagreement_analysis=(
-                provable_data.disagreement.model_dump()
-                if provable_data.disagreement and provable_data.disagreement.has_disagreement
+                disagreement.model_dump()
+                if disagreement and disagreement.has_disagreement
                 else None
             ),
             research_started_at=research_started_at,
             research_completed_at=research_completed_at,
-            # Detect mock IPFS: mock CIDs are locally generated SHA256 hashes
-            ipfs_mock=(
-                result.ipfs_cid is None
-                or not result.ipfs_cid
-                or os.path.exists(
-                    os.path.join(os.getcwd(), ".ipfs_mock", f"{result.ipfs_cid}.json")
-                )
-            ),
+            ipfs_mock=_is_mock_cid(result.ipfs_cid),
         )
 
     except Exception as e:
@@ -1268,23 +1680,25 @@ def _validate_callback_url(url: str) -> None:
         raise ValueError(f"Callback URL resolves to non-public address: {addr}")
 
 
-async def _send_webhook(url: str, result: ResultResponse):
-    """Send webhook notification."""
-    import httpx
+_WEBHOOK_HEADERS = {"content-type": "application/json"}
+
 
+async def _send_webhook(url: str, body: bytes):
+    """Send webhook notification with a pre-encoded JSON body."""
     try:
-        _validate_callback_url(url)
-    except ValueError as e:
+        # Validation may resolve the hostname, which blocks
+        await asyncio.to_thread(_validate_callback_url, url)
+    except (ValueError, OSError) as e:
         logger.error(f"SSRF blocked: {e}")
         return
 
     try:
-        async with httpx.AsyncClient() as client:
-            await client.post(
-                url,
-                json=result.model_dump(),
-                timeout=10,
-            )
+        await api_instance.get_http().post(
+            url,
+            content=body,
+            headers=_WEBHOOK_HEADERS,
+            timeout=10,
+        )
         logger.info(f"Webhook sent to {url}")
     except Exception as e:
         logger.error(f"Webhook failed: {e}")
@@ -1297,7 +1711,6 @@ async def _execute_multi_outcome_resolution(
     """Execute multi-outcome resolution with full verification data."""
     from oracle.agents import StrategyFactory
     from oracle.consensus import StrictConsensusConfig, StrictConsensusEngine
-    from oracle.storage import OracleResearchDataBuilder
 
     if not api_instance.oracle:
         return MultiOutcomeResultResponse(
@@ -1307,11 +1720,9 @@ async def _execute_multi_outcome_resolution(
             error="Oracle not initialized",
         )
 
-    research_started_at = datetime.now(UTC).isoformat()
-
     try:
-        threshold = request.consensus_threshold or float(
-            os.getenv("MULTI_OUTCOME_CONSENSUS_THRESHOLD", "0.80")
+        threshold = (
+            request.consensus_threshold or get_settings().multi_outcome_consensus_threshold
         )
 
         result = await api_instance.oracle.resolve_multi_outcome(
@@ -1323,7 +1734,8 @@ async def _execute_multi_outcome_resolution(
             consensus_threshold=threshold,
         )
 
-        research_completed_at = datetime.now(UTC).isoformat()
+        research_started_at = result.research_started_at
+        research_completed_at = result.research_completed_at
 
         # Build research data for hashing
         builder = OracleResearchDataBuilder(
@@ -1362,18 +1774,15 @@ async def _execute_multi_outcome_resolution(
         builder.set_merged_sources(result.merged_sources)
 
         agent_count = request.agent_count or 5
-        strategies = [p.value for p in StrategyFactory.get_recommended_profiles(agent_count)]
+        strategies = StrategyFactory.get_recommended_strategy_names(agent_count)
 
-        oracle_config = builder.build_config(
+        builder.build_config(
             agent_count=agent_count,
             agent_strategies=strategies,
             consensus_threshold=threshold,
         )
 
-        _, config_hash = oracle_config.get_hash_data()
-
-        research_data = builder.build()
-        _, research_hash = research_data.get_hash_data()
+        config_hash = builder.oracle_config_hash
 
         # Run strict consensus for verification data
         strict_engine = StrictConsensusEngine(
@@ -1393,10 +1802,14 @@ async def _execute_multi_outcome_resolution(
             for ar in result.agent_results
         ]
         strict_consensus, provable_data = strict_engine.calculate_strict(binary_results_for_strict)
+        disagreement = provable_data.disagreement
+
+        # Build, serialize and hash the research data off the event loop
+        research_hash = await asyncio.to_thread(_research_data_hash, builder)
 
         winning = result.consensus.winning_outcome
 
-        return MultiOutcomeResultResponse(
+        return MultiOutcomeResultResponse.model_construct(
             request_id=request_id,
             market_id=request.market_id,
             status="completed",
@@ -1408,9 +1821,7 @@ async def _execute_multi_outcome_resolution(
             agreement_ratio=result.consensus.agreement_ratio,
             weighted_ratio=result.consensus.weighted_ratio,
             consensus_reached=result.consensus.reached,
-            agent_count=len(result.agent_results),
-            valid_agent_count=sum(1 for r in result.agent_results if r.is_valid),
-            total_sources=sum(len(r.sources) for r in result.agent_results),
+            **_agent_stats(result.agent_results),
             unique_sources=len(result.merged_sources),
             tier1_sources=provable_data.verification.tier1_sources,
             tier2_sources=provable_data.verification.tier2_sources,
@@ -1422,28 +1833,20 @@ async def _execute_multi_outcome_resolution(
             verification_issues=provable_data.verification.issues,
             requires_manual_review=(
                 result.consensus.requires_human_review
-                or (
-                    provable_data.disagreement and provable_data.disagreement.requires_manual_review
-                )
+                or bool(disagreement and disagreement.requires_manual_review)
             ),
             review_reason=(
                 result.consensus.reason
-                or (provable_data.disagreement.review_reason if provable_data.disagreement else None)
+                or (disagreement.review_reason if disagreement else None)
             ),
             disagreement_analysis=(
-                provable_data.disagreement.model_dump()
-                if provable_data.disagreement and provable_data.disagreement.has_disagreement
+                disagreement.model_dump()
+                if disagreement and disagreement.has_disagreement
                 else None
             ),
             research_started_at=research_started_at,
             research_completed_at=research_completed_at,
-            ipfs_mock=(
-                result.ipfs_cid is None
-                or not result.ipfs_cid
-                or os.path.exists(
-                    os.path.join(os.getcwd(), ".ipfs_mock", f"{result.ipfs_cid}.json")
-                )
-            ),
+            ipfs_mock=_is_mock_cid(result.ipfs_cid),
         )
 
     except Exception as e:
@@ -1456,23 +1859,57 @@ async def _execute_multi_outcome_resolution(
         )
 
 
-# Create global app instance for uvicorn
-app = create_app()
+app: FastAPI
 
 
-def run_server(host: str = None, port: int = None):
-    """Run the API server."""
-    from dotenv import load_dotenv
+def __getattr__(name: str) -> Any:
+    """
+    Build the module-level ``app`` on first access.
+
+    Keeps ``uvicorn oracle.api.server:app`` working without importing the
+    module reading .env or wiring up the app as a side effect.
+    """
+    if name == "app":
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    load_dotenv()
+
+def run_server(host: str = None, port: int = None, workers: int | None = None):
+    """
+    Run the API server.
+
+    workers > 1 starts that many processes and requires the Redis result
+    store (ORACLE_STORE=redis); otherwise a single worker is used.
+    """
+    settings = get_settings()
 
     if host is None:
-        host = os.getenv("API_HOST", "0.0.0.0")
+        host = settings.api_host
     if port is None:
-        port = int(os.getenv("API_PORT", "8989"))
-
-    logger.info("Starting Oracle API server", host=host, port=port)
-    uvicorn.run(app, host=host, port=port)
+        port = settings.api_port
+
+    # Worker processes only share results through Redis; with the in-memory
+    # store a poll could land on a worker that never saw the request.
+    if workers is None:
+        workers = settings.api_workers
+    if workers > 1 and settings.result_store_backend != "redis":
+        logger.warning("API_WORKERS > 1 requires the Redis result store, running a single worker")
+        workers = 1
+
+    logger.info("Starting Oracle API server", host=host, port=port, workers=workers)
+    uvicorn.run(
+        "oracle.api.server:create_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        # Both ship with uvicorn[standard]; be explicit so a missing package
+        # fails loudly instead of silently falling back to asyncio/h11.
+        loop="uvloop",
+        http="httptools",
+    )
 
 
 if __name__ == "__main__":
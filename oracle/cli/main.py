@@ -8,6 +8,7 @@ Usage:
 
 import asyncio
 
+import orjson
 import typer
 from rich.console import Console
 from rich.panel import Panel
@@ -52,21 +53,25 @@ async def _resolve_async(
     """Async resolution handler."""
     from oracle.core import MultiAgentOracle, OracleConfig
 
-    console.print()
-    console.print(
-        Panel.fit(
-            f"[bold blue]Question:[/bold blue] {question}\n"
-            f"[bold blue]Criteria:[/bold blue] {criteria}\n"
-            f"[bold blue]Agents:[/bold blue] {agents}",
-            title="🔮 Multi-Agent Oracle",
+    # --json is for scripts: no banner, and no spinner re-rendering for the
+    # whole resolution
+    if not output_json:
+        console.print()
+        console.print(
+            Panel.fit(
+                f"[bold blue]Question:[/bold blue] {question}\n"
+                f"[bold blue]Criteria:[/bold blue] {criteria}\n"
+                f"[bold blue]Agents:[/bold blue] {agents}",
+                title="🔮 Multi-Agent Oracle",
+            )
         )
-    )
-    console.print()
+        console.print()
 
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        disable=output_json,
     ) as progress:
         task = progress.add_task("Initializing oracle...", total=None)
 
@@ -87,12 +92,8 @@ async def _resolve_async(
             console.print(f"[red]Error: {e}[/red]")
             raise typer.Exit(1) from None
 
-    console.print()
-
     # Output as JSON
     if output_json:
-        import json
-
         json_output = {
             "request_id": result.request_id,
             "outcome": result.consensus.outcome.value,
@@ -105,12 +106,14 @@ async def _resolve_async(
         console.print_json(data=json_output)
 
         if save_to:
-            with open(save_to, "w") as f:
-                json.dump(json_output, f, indent=2)
+            with open(save_to, "wb") as f:
+                f.write(orjson.dumps(json_output, option=orjson.OPT_INDENT_2))
             console.print(f"\n[green]Saved to {save_to}[/green]")
 
         return
 
+    console.print()
+
     # Display result
     outcome_color = {
         "YES": "green",
@@ -135,9 +138,10 @@ async def _resolve_async(
         "Outcome", f"[bold {outcome_color}]{result.consensus.outcome.value}[/bold {outcome_color}]"
     )
     table.add_row("Confidence", f"{result.consensus.confidence:.1%}")
+    agreeing = sum(r.outcome == result.consensus.outcome for r in result.agent_results)
     table.add_row(
         "Agreement",
-        f"{result.consensus.agreement_ratio:.0%} ({len([r for r in result.agent_results if r.outcome == result.consensus.outcome])}/{len(result.agent_results)} agents)",
+        f"{result.consensus.agreement_ratio:.0%} ({agreeing}/{len(result.agent_results)} agents)",
     )
     table.add_row("Total Sources", str(len(result.merged_sources)))
     if result.ipfs_cid:
@@ -178,10 +182,8 @@ async def _resolve_async(
     console.print()
 
     if save_to:
-        import json
-
-        with open(save_to, "w") as f:
-            json.dump(result.model_dump(), f, indent=2, default=str)
+        with open(save_to, "wb") as f:
+            f.write(orjson.dumps(result.model_dump(mode="json"), option=orjson.OPT_INDENT_2))
         console.print(f"[green]Full result saved to {save_to}[/green]")
 
 
@@ -190,6 +192,12 @@ def serve(
     host: str = typer.Option("0.0.0.0", "--host", "-h", help="Host to bind to"),
     port: int = typer.Option(8090, "--port", "-p", help="Port to bind to"),
     reload: bool = typer.Option(False, "--reload", help="Enable auto-reload"),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        help="Worker processes (default: API_WORKERS or WEB_CONCURRENCY; >1 needs Redis)",
+    ),
 ):
     """
     Start the Oracle API server.
@@ -199,7 +207,7 @@ def serve(
     """
     import uvicorn
 
-    from oracle.api.server import create_app
+    from oracle.api.server import run_server
 
     console.print()
     console.print(
@@ -219,10 +227,11 @@ def serve(
             port=port,
             reload=True,
             factory=True,
+            loop="uvloop",
+            http="httptools",
         )
     else:
-        app = create_app()
-        uvicorn.run(app, host=host, port=port)
+        run_server(host=host, port=port, workers=workers)
 
 
 @app.command()
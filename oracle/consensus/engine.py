@@ -19,6 +19,9 @@ from oracle.models import (
 
 logger = structlog.get_logger()
 
+# Source quality bonus for any agent that cites at least one source
+DIVERSITY_BONUS = 0.2
+
 
 def _default_min_agents() -> int:
     return int(os.getenv("MIN_VALID_AGENTS", os.getenv("MIN_AGENTS", "2")))
@@ -162,11 +165,12 @@ class ConsensusEngine:
         if effective_ratio >= self.config.threshold:
             # Consensus reached
             winning_results = votes[winning_outcome]
-            merged_sources = self._merge_sources(winning_results)
             avg_confidence = sum(r.confidence for r in winning_results) / len(winning_results)
 
-            # Calculate source overlap
-            source_overlap = self._calculate_source_overlap(winning_results)
+            # Only counts are reported here, so skip the full merge (clones +
+            # quality sort); callers that need merged sources run _merge_sources.
+            url_sets = [{s.url for s in r.sources} for r in winning_results]
+            source_overlap = self._pairwise_overlap(url_sets)
 
             return ConsensusResult(
                 reached=True,
@@ -175,7 +179,7 @@ class ConsensusEngine:
                 agreement_ratio=winning_ratio,
                 weighted_ratio=weighted_ratio,
                 total_sources=sum(len(r.sources) for r in winning_results),
-                unique_sources=len(merged_sources),
+                unique_sources=len(set().union(*url_sets)),
                 source_overlap=source_overlap,
                 agent_count=len(valid_results),
                 requires_human_review=False,
@@ -193,6 +197,43 @@ class ConsensusEngine:
                 reason=f"No supermajority: highest agreement is {winning_ratio:.1%}",
             )
 
+    def is_decided(self, results: list[AgentResult], pending: int) -> bool:
+        """
+        Whether pending agents can no longer change a reached consensus.
+
+        Vote weights are at most 1.0, so this assumes every pending agent
+        casts a full-weight vote against the current leader.
+
+        Args:
+            results: Agent results received so far
+            pending: Number of agents still running
+
+        Returns:
+            True if calculate() would reach the same outcome whatever they return
+        """
+        valid_results = [r for r in results if r.is_valid]
+        if len(valid_results) < self.config.min_agents:
+            return False
+
+        counts = {Outcome.YES: 0, Outcome.NO: 0}
+        weights = {Outcome.YES: 0.0, Outcome.NO: 0.0}
+        for result in valid_results:
+            if result.outcome in weights:
+                counts[result.outcome] += 1
+                weights[result.outcome] += self._calculate_vote_weight(result)
+
+        leader = max(weights, key=weights.__getitem__)
+        decisive_weight = sum(weights.values())
+        # Pending votes could still tie or overtake the leader
+        if weights[leader] <= decisive_weight - weights[leader] + pending:
+            return False
+
+        if self.config.use_weighted_voting:
+            ratio = weights[leader] / (decisive_weight + pending)
+        else:
+            ratio = counts[leader] / (len(valid_results) + pending)
+        return ratio >= self.config.threshold
+
     def _calculate_vote_weight(self, result: AgentResult) -> float:
         """Calculate voting weight for an agent's result."""
         # Base: confidence (0-1)
@@ -217,22 +258,19 @@ class ConsensusEngine:
         # Average credibility
         avg_credibility = sum(s.credibility_score for s in sources) / len(sources)
 
-        # Category diversity bonus (0-0.2 based on 5 categories)
-        categories = {s.category for s in sources}
-        diversity_bonus = min(len(categories) / 5, 0.2)
-
-        return min(avg_credibility + diversity_bonus, 1.0)
+        # Category diversity bonus: min(categories / 5, 0.2) already hits the
+        # 0.2 cap with a single category, so there is no need to collect them.
+        return min(avg_credibility + DIVERSITY_BONUS, 1.0)
 
     def _merge_sources(self, results: list[AgentResult]) -> list[ResearchSource]:
         """Merge and deduplicate sources from agreeing agents."""
-        seen_urls: set[str] = set()
-        merged: list[ResearchSource] = []
+        # Sources by URL, in first-seen (i.e. best-quality) order
+        by_url: dict[str, ResearchSource] = {}
 
         # Collect all sources with their citing agents
-        all_sources: list[tuple[ResearchSource, str]] = []
-        for result in results:
-            for source in result.sources:
-                all_sources.append((source, result.agent_id))
+        all_sources: list[tuple[ResearchSource, str]] = [
+            (source, result.agent_id) for result in results for source in result.sources
+        ]
 
         # Sort by quality (relevance × credibility)
         all_sources.sort(
@@ -240,35 +278,32 @@ class ConsensusEngine:
             reverse=True,
         )
 
-        # Deduplicate
+        # Deduplicate, keeping the best-quality copy of each URL
         for source, agent_id in all_sources:
-            if source.url not in seen_urls:
-                # Create new source with cited_by
+            existing = by_url.get(source.url)
+            if existing is None:
                 new_source = source.model_copy()
                 new_source.cited_by = [agent_id]
-                merged.append(new_source)
-                seen_urls.add(source.url)
-            else:
-                # Add to existing source's cited_by
-                for existing in merged:
-                    if existing.url == source.url:
-                        if agent_id not in existing.cited_by:
-                            existing.cited_by.append(agent_id)
-                        break
+                by_url[source.url] = new_source
+            elif agent_id not in existing.cited_by:
+                existing.cited_by.append(agent_id)
 
+        merged = list(by_url.values())
         logger.info(f"Merged {len(merged)} unique sources from {len(results)} agents")
         return merged
 
     def _calculate_source_overlap(self, results: list[AgentResult]) -> float:
         """Calculate average pairwise source overlap between agents."""
-        if len(results) < 2:
+        return self._pairwise_overlap([{s.url for s in r.sources} for r in results])
+
+    @staticmethod
+    def _pairwise_overlap(agent_urls: list[set[str]]) -> float:
+        """Average pairwise Jaccard overlap of per-agent URL sets."""
+        if len(agent_urls) < 2:
             return 1.0
 
         overlaps: list[float] = []
 
-        # Get URLs for each agent
-        agent_urls: list[set[str]] = [{s.url for s in r.sources} for r in results]
-
         # Calculate pairwise overlap
         for i in range(len(agent_urls)):
             for j in range(i + 1, len(agent_urls)):
@@ -276,10 +311,10 @@ class ConsensusEngine:
                 urls_b = agent_urls[j]
 
                 if urls_a and urls_b:
-                    intersection = urls_a & urls_b
-                    union = urls_a | urls_b
-                    overlap = len(intersection) / len(union) if union else 0
-                    overlaps.append(overlap)
+                    # |A ∪ B| = |A| + |B| - |A ∩ B|, so the union set is never built
+                    intersection = len(urls_a & urls_b)
+                    union = len(urls_a) + len(urls_b) - intersection
+                    overlaps.append(intersection / union)
 
         return sum(overlaps) / len(overlaps) if overlaps else 0.0
 
@@ -13,6 +13,7 @@ import os
 import structlog
 from pydantic import BaseModel, Field
 
+from oracle.consensus.engine import DIVERSITY_BONUS
 from oracle.models import (
     MultiOutcome,
     MultiOutcomeAgentResult,
@@ -136,7 +137,6 @@ class MultiOutcomeConsensusEngine:
 
         if effective_ratio >= self.config.threshold and winning_label != "UNDETERMINED":
             winning_results = bins[winning_label]
-            merged_sources = self._merge_sources(winning_results)
             avg_confidence = sum(r.confidence for r in winning_results) / len(winning_results)
 
             # Find the outcome index for the winning label
@@ -156,7 +156,7 @@ class MultiOutcomeConsensusEngine:
                 weighted_ratio=weighted_ratio,
                 vote_distribution=vote_distribution,
                 total_sources=sum(len(r.sources) for r in winning_results),
-                unique_sources=len(merged_sources),
+                unique_sources=len({s.url for r in winning_results for s in r.sources}),
                 agent_count=len(valid_results),
                 requires_human_review=False,
             )
@@ -183,18 +183,14 @@ class MultiOutcomeConsensusEngine:
         if not sources:
             return 0.0
         avg_credibility = sum(s.credibility_score for s in sources) / len(sources)
-        categories = {s.category for s in sources}
-        diversity_bonus = min(len(categories) / 5, 0.2)
-        return min(avg_credibility + diversity_bonus, 1.0)
+        return min(avg_credibility + DIVERSITY_BONUS, 1.0)
 
     def _merge_sources(self, results: list[MultiOutcomeAgentResult]) -> list[ResearchSource]:
-        seen_urls: set[str] = set()
-        merged: list[ResearchSource] = []
+        by_url: dict[str, ResearchSource] = {}
 
-        all_sources: list[tuple[ResearchSource, str]] = []
-        for result in results:
-            for source in result.sources:
-                all_sources.append((source, result.agent_id))
+        all_sources: list[tuple[ResearchSource, str]] = [
+            (source, result.agent_id) for result in results for source in result.sources
+        ]
 
         all_sources.sort(
             key=lambda x: x[0].relevance_score * x[0].credibility_score,
@@ -202,16 +198,13 @@ class MultiOutcomeConsensusEngine:
         )
 
         for source, agent_id in all_sources:
-            if source.url not in seen_urls:
+            existing = by_url.get(source.url)
+            if existing is None:
                 new_source = source.model_copy()
                 new_source.cited_by = [agent_id]
-                merged.append(new_source)
-                seen_urls.add(source.url)
-            else:
-                for existing in merged:
-                    if existing.url == source.url:
-                        if agent_id not in existing.cited_by:
-                            existing.cited_by.append(agent_id)
-                        break
+                by_url[source.url] = new_source
+            elif agent_id not in existing.cited_by:
+                existing.cited_by.append(agent_id)
 
+        merged = list(by_url.values())
         return merged
@@ -7,19 +7,22 @@ and detailed disagreement analysis for on-chain oracle resolution.
 Task ID: 2.5.1 - 2.5.13 from IMPLEMENTATION-TRACKER.md
 """
 
+import bisect
+import functools
 import hashlib
-import json
+import itertools
+from collections import Counter
 from datetime import datetime, timezone
 
+import orjson
 import structlog
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field
 
 from oracle.consensus.engine import ConsensusConfig, ConsensusEngine
 from oracle.models import (
     AgentResult,
     ConsensusResult,
     Outcome,
-    ResearchSource,
     SourceCategory,
 )
 from oracle.research.reasoning_chain import ReasoningChain
@@ -29,6 +32,27 @@ from oracle.research.website_tracker import WebsiteTracker
 logger = structlog.get_logger()
 
 
+# Lower credibility bound of each tier above the lowest, ascending, and the
+# tier names for the buckets they delimit
+_TIER_EDGES = (0.5, 0.7, 0.9)
+_TIER_NAMES = ("tier_4_5", "tier_3", "tier_2", "tier_1")
+
+# Categories that count towards Tier 1/Tier 2 whatever their credibility
+_TIER1_CATEGORIES = frozenset({SourceCategory.OFFICIAL})
+_TIER2_CATEGORIES = frozenset({SourceCategory.NEWS})
+
+
+@functools.lru_cache(maxsize=256)
+def _credibility_tier(credibility_score: float) -> str:
+    """
+    Tier label for a credibility score, as reported in tier_distribution.
+
+    Agents reuse a handful of scores, so the lookup runs once per distinct
+    score rather than once per source.
+    """
+    return _TIER_NAMES[bisect.bisect_right(_TIER_EDGES, credibility_score)]
+
+
 class StrictConsensusConfig(ConsensusConfig):
     """
     Extended configuration for strict consensus calculation.
@@ -78,6 +102,8 @@ class StrictConsensusConfig(ConsensusConfig):
 class VerificationResult(BaseModel):
     """Result of source and fact verification."""
 
+    model_config = ConfigDict(frozen=True)
+
     passed: bool = Field(..., description="Whether verification passed")
     tier1_sources: int = Field(default=0)
     tier2_sources: int = Field(default=0)
@@ -96,6 +122,8 @@ class DisagreementAnalysis(BaseModel):
     Task 2.5.10-2.5.11: Implement disagreement analysis.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     has_disagreement: bool = Field(default=False)
     outcome_distribution: dict[str, int] = Field(default_factory=dict)
     confidence_stats: dict = Field(default_factory=dict)
@@ -112,8 +140,13 @@ class ProvableConsensusData(BaseModel):
     Provable consensus data for on-chain verification.
 
     Task 2.5.12-2.5.13: Generate provable data.
+
+    Frozen, so the lazily computed data_hash cannot go stale after a
+    field is changed.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     # Consensus summary
     consensus_reached: bool
     outcome: str
@@ -136,21 +169,23 @@ class ProvableConsensusData(BaseModel):
     # Timestamps
     calculated_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
 
-    # Hash for verification
-    data_hash: str | None = Field(None)
+    # Hash for verification, computed on first access (see data_hash)
+    _data_hash: str | None = PrivateAttr(default=None)
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def data_hash(self) -> str:
+        """SHA256 of the provable data; only hashed when something reads it."""
+        if self._data_hash is None:
+            self._data_hash = self.calculate_hash()
+        return self._data_hash
 
     def calculate_hash(self) -> str:
         """Calculate SHA256 hash of the provable data."""
-        # Exclude the hash field itself
-        data = self.model_dump(exclude={"data_hash"})
-        # Sort for deterministic output
-        json_str = json.dumps(data, sort_keys=True, default=str)
-        return hashlib.sha256(json_str.encode()).hexdigest()
-
-    def model_post_init(self, __context) -> None:
-        """Calculate hash after initialization."""
-        if self.data_hash is None:
-            self.data_hash = self.calculate_hash()
+        # Exclude the hash field itself; mode="json" coerces enums/datetimes
+        data = self.model_dump(exclude={"data_hash"}, mode="json")
+        # Sorted keys, compact separators, UTF-8 bytes straight into the hash
+        return hashlib.sha256(orjson.dumps(data, option=orjson.OPT_SORT_KEYS)).hexdigest()
 
 
 class StrictConsensusEngine(ConsensusEngine):
@@ -201,15 +236,14 @@ class StrictConsensusEngine(ConsensusEngine):
         """
         logger.info(f"Calculating strict consensus from {len(results)} agents")
 
+        cfg = self.strict_config
+
         # Step 1: Verify source requirements
         verification = self._verify_sources(results)
 
         # Step 2: Filter by confidence threshold
-        qualified_results = [
-            r
-            for r in results
-            if r.is_valid and r.confidence >= self.strict_config.min_individual_confidence
-        ]
+        min_confidence = cfg.min_individual_confidence
+        qualified_results = [r for r in results if r.is_valid and r.confidence >= min_confidence]
 
         logger.info(
             f"Qualified results: {len(qualified_results)}/{len(results)}",
@@ -217,11 +251,11 @@ class StrictConsensusEngine(ConsensusEngine):
         )
 
         # Step 3: Calculate base consensus
-        if len(qualified_results) < self.strict_config.min_agents:
+        if len(qualified_results) < cfg.min_agents:
             consensus = ConsensusResult(
                 reached=False,
                 outcome=Outcome.UNDETERMINED,
-                reason=f"Only {len(qualified_results)} qualified results, need {self.strict_config.min_agents}",
+                reason=f"Only {len(qualified_results)} qualified results, need {cfg.min_agents}",
                 agent_count=len(results),
                 requires_human_review=True,
             )
@@ -231,10 +265,10 @@ class StrictConsensusEngine(ConsensusEngine):
         # Step 4: Additional verification checks
         if consensus.reached:
             # Check if confidence meets minimum
-            if consensus.confidence < self.strict_config.min_consensus_confidence:
+            if consensus.confidence < cfg.min_consensus_confidence:
                 consensus.reached = False
                 consensus.requires_human_review = True
-                consensus.reason = f"Confidence {consensus.confidence:.1%} below minimum {self.strict_config.min_consensus_confidence:.1%}"
+                consensus.reason = f"Confidence {consensus.confidence:.1%} below minimum {cfg.min_consensus_confidence:.1%}"
 
             # Source tier verification is a quality signal, not a blocker.
             # Google Search grounding sources often lack tier classification,
@@ -273,81 +307,68 @@ class StrictConsensusEngine(ConsensusEngine):
 
         Task 2.5.5-2.5.6: Implement source verification.
         """
+        cfg = self.strict_config
+
+        # Too few agents for consensus at all: skip the sweep over their sources
+        if len(results) < cfg.min_agents:
+            return VerificationResult.model_construct(
+                passed=False,
+                issues=[f"Insufficient agents: {len(results)}/{cfg.min_agents}"],
+            )
+
         issues: list[str] = []
         warnings: list[str] = []
 
-        # Collect all sources
-        all_sources: list[ResearchSource] = []
-        seen_urls: set[str] = set()
+        # Tally everything in one sweep over the sources
+        total_count = tier1_count = tier2_count = 0
+        url_agents: dict[str, set[str]] = {}
+        category_set: set[str] = set()
 
         for result in results:
             for source in result.sources:
-                all_sources.append(source)
-                seen_urls.add(source.url)
+                total_count += 1
+                url_agents.setdefault(source.url, set()).add(result.agent_id)
+                category_set.add(source.category.value)
 
-        unique_count = len(seen_urls)
+                # Count by tier (based on category or credibility)
+                tier = _credibility_tier(source.credibility_score)
+                tier1_count += source.category in _TIER1_CATEGORIES or tier == "tier_1"
+                tier2_count += source.category in _TIER2_CATEGORIES or tier == "tier_2"
 
-        # Count by tier (based on category)
-        tier1_categories = {SourceCategory.OFFICIAL}
-        tier2_categories = {SourceCategory.NEWS}
-
-        tier1_count = sum(
-            1 for s in all_sources if s.category in tier1_categories or s.credibility_score >= 0.9
-        )
-        tier2_count = sum(
-            1
-            for s in all_sources
-            if s.category in tier2_categories or 0.7 <= s.credibility_score < 0.9
-        )
-
-        # Get unique categories
-        categories = list({s.category.value for s in all_sources})
+        unique_count = len(url_agents)
+        categories = list(category_set)
 
         # Check requirements
         passed = True
 
-        if tier1_count < self.strict_config.min_tier1_sources:
-            issues.append(
-                f"Insufficient Tier 1 sources: {tier1_count}/{self.strict_config.min_tier1_sources}"
-            )
+        if tier1_count < cfg.min_tier1_sources:
+            issues.append(f"Insufficient Tier 1 sources: {tier1_count}/{cfg.min_tier1_sources}")
             passed = False
 
-        if tier2_count < self.strict_config.min_tier2_sources:
-            issues.append(
-                f"Insufficient Tier 2 sources: {tier2_count}/{self.strict_config.min_tier2_sources}"
-            )
+        if tier2_count < cfg.min_tier2_sources:
+            issues.append(f"Insufficient Tier 2 sources: {tier2_count}/{cfg.min_tier2_sources}")
             passed = False
 
-        if (
-            self.strict_config.require_source_diversity
-            and len(categories) < self.strict_config.min_source_categories
-        ):
+        if cfg.require_source_diversity and len(categories) < cfg.min_source_categories:
             warnings.append(
-                f"Limited source diversity: {len(categories)}/{self.strict_config.min_source_categories} categories"
+                f"Limited source diversity: {len(categories)}/{cfg.min_source_categories} categories"
             )
 
         # Cross-verification check (simplified)
-        # Count sources cited by multiple agents
-        url_citation_count: dict[str, int] = {}
-        for result in results:
-            for source in result.sources:
-                url_citation_count[source.url] = url_citation_count.get(source.url, 0) + 1
+        # Count sources cited by multiple distinct agents
+        cross_verified = sum(1 for agents in url_agents.values() if len(agents) >= 2)
 
-        cross_verified = sum(1 for count in url_citation_count.values() if count >= 2)
-
-        if (
-            self.strict_config.require_cross_verification
-            and cross_verified < self.strict_config.min_cross_verified_facts
-        ):
+        if cfg.require_cross_verification and cross_verified < cfg.min_cross_verified_facts:
             warnings.append(
-                f"Limited cross-verification: {cross_verified}/{self.strict_config.min_cross_verified_facts} facts"
+                f"Limited cross-verification: {cross_verified}/{cfg.min_cross_verified_facts} facts"
             )
 
-        return VerificationResult(
+        # Every field is computed above, so skip re-validation
+        return VerificationResult.model_construct(
             passed=passed,
             tier1_sources=tier1_count,
             tier2_sources=tier2_count,
-            total_sources=len(all_sources),
+            total_sources=total_count,
             unique_sources=unique_count,
             source_categories=categories,
             cross_verified_facts=cross_verified,
@@ -364,32 +385,39 @@ class StrictConsensusEngine(ConsensusEngine):
 
         Task 2.5.10-2.5.11: Implement analyze_disagreement_detailed().
         """
-        # Basic analysis from parent
-        self.analyze_disagreement(results)
-
-        # Count outcomes
-        outcome_dist: dict[str, int] = {}
+        # Group results by outcome value (read once per result), then count
+        results_by_outcome: dict[str, list[AgentResult]] = {}
         for result in results:
-            key = result.outcome.value
-            outcome_dist[key] = outcome_dist.get(key, 0) + 1
+            results_by_outcome.setdefault(result.outcome.value, []).append(result)
+        outcome_dist = {key: len(group) for key, group in results_by_outcome.items()}
 
         # Check for disagreement
         has_disagreement = len(outcome_dist) > 1
 
         # Confidence statistics
         confidences = [r.confidence for r in results if r.is_valid]
-        conf_stats = {
-            "min": min(confidences) if confidences else 0.0,
-            "max": max(confidences) if confidences else 0.0,
-            "mean": sum(confidences) / len(confidences) if confidences else 0.0,
-            "spread": (max(confidences) - min(confidences)) if confidences else 0.0,
-        }
+        if confidences:
+            low, high = min(confidences), max(confidences)
+            conf_stats = {
+                "min": low,
+                "max": high,
+                "mean": sum(confidences) / len(confidences),
+                "spread": high - low,
+            }
+        else:
+            conf_stats = {"min": 0.0, "max": 0.0, "mean": 0.0, "spread": 0.0}
+        high_spread = conf_stats["spread"] > self.strict_config.max_confidence_spread
+
+        # Full agreement with a tight spread: nothing further to analyze
+        if not has_disagreement and not high_spread:
+            return DisagreementAnalysis.model_construct(
+                outcome_distribution=outcome_dist,
+                confidence_stats=conf_stats,
+            )
 
         # Source overlap by outcome
         source_overlap_by_outcome: dict[str, float] = {}
-        for outcome_value in outcome_dist:
-            outcome = Outcome(outcome_value)
-            outcome_results = [r for r in results if r.outcome == outcome]
+        for outcome_value, outcome_results in results_by_outcome.items():
             if len(outcome_results) >= 2:
                 source_overlap_by_outcome[outcome_value] = self._calculate_source_overlap(
                     outcome_results
@@ -398,33 +426,35 @@ class StrictConsensusEngine(ConsensusEngine):
         # Identify conflicting evidence
         conflicting_evidence: list[dict] = []
         if has_disagreement:
-            # Find sources supporting different outcomes
-            sources_by_outcome: dict[str, list[str]] = {}
-            for result in results:
-                key = result.outcome.value
-                if key not in sources_by_outcome:
-                    sources_by_outcome[key] = []
-                sources_by_outcome[key].extend([s.url for s in result.sources])
-
-            # Find overlapping sources between different outcomes
-            outcomes = list(sources_by_outcome.keys())
-            for i in range(len(outcomes)):
-                for j in range(i + 1, len(outcomes)):
-                    set_a = set(sources_by_outcome[outcomes[i]])
-                    set_b = set(sources_by_outcome[outcomes[j]])
-                    overlap = set_a & set_b
-                    if overlap:
-                        conflicting_evidence.append(
-                            {
-                                "outcomes": [outcomes[i], outcomes[j]],
-                                "shared_sources": list(overlap)[:5],  # Limit
-                                "interpretation_conflict": True,
-                            }
-                        )
+            # Outcomes each source was cited for, in first-seen order
+            url_outcomes: dict[str, set[str]] = {}
+            for key, outcome_results in results_by_outcome.items():
+                for result in outcome_results:
+                    for source in result.sources:
+                        url_outcomes.setdefault(source.url, set()).add(key)
+
+            # Sources shared between each pair of outcomes
+            outcomes = list(outcome_dist)
+            rank = {outcome: i for i, outcome in enumerate(outcomes)}
+            shared_by_pair: dict[tuple[str, str], list[str]] = {}
+            for url, keys in url_outcomes.items():
+                if len(keys) >= 2:
+                    for pair in itertools.combinations(sorted(keys, key=rank.__getitem__), 2):
+                        shared_by_pair.setdefault(pair, []).append(url)
+
+            conflicting_evidence = [
+                {
+                    "outcomes": list(pair),
+                    "shared_sources": shared_by_pair[pair][:5],  # Limit
+                    "interpretation_conflict": True,
+                }
+                for pair in itertools.combinations(outcomes, 2)
+                if pair in shared_by_pair
+            ]
 
         # Contributing factors
         factors: list[str] = []
-        if conf_stats["spread"] > self.strict_config.max_confidence_spread:
+        if high_spread:
             factors.append("High confidence spread among agents")
         if len(conflicting_evidence) > 0:
             factors.append("Same sources interpreted differently")
@@ -433,7 +463,7 @@ class StrictConsensusEngine(ConsensusEngine):
 
         # Recommendations
         recommendations: list[str] = []
-        if conf_stats["spread"] > self.strict_config.max_confidence_spread:
+        if high_spread:
             recommendations.append("Consider human review due to confidence variance")
         if len(outcome_dist) > 2:
             recommendations.append("Resolution criteria may need clarification")
@@ -441,19 +471,17 @@ class StrictConsensusEngine(ConsensusEngine):
             recommendations.append("Low overall confidence - verify with additional sources")
 
         # Determine if manual review required
-        requires_review = (
-            conf_stats["spread"] > self.strict_config.max_confidence_spread
-            or len(conflicting_evidence) > 2
-        )
+        requires_review = high_spread or len(conflicting_evidence) > 2
 
         review_reason = None
         if requires_review:
-            if conf_stats["spread"] > self.strict_config.max_confidence_spread:
+            if high_spread:
                 review_reason = "High confidence variance"
             elif len(conflicting_evidence) > 2:
                 review_reason = "Significant evidence conflicts"
 
-        return DisagreementAnalysis(
+        # Every field is computed above, so skip re-validation
+        return DisagreementAnalysis.model_construct(
             has_disagreement=has_disagreement,
             outcome_distribution=outcome_dist,
             confidence_stats=conf_stats,
@@ -478,20 +506,16 @@ class StrictConsensusEngine(ConsensusEngine):
         Task 2.5.12-2.5.13: Implement generate_provable_data().
         """
         # Tier distribution
-        tier_dist: dict[str, int] = {}
-        for result in results:
-            for source in result.sources:
-                if source.credibility_score >= 0.9:
-                    tier = "tier_1"
-                elif source.credibility_score >= 0.7:
-                    tier = "tier_2"
-                elif source.credibility_score >= 0.5:
-                    tier = "tier_3"
-                else:
-                    tier = "tier_4_5"
-                tier_dist[tier] = tier_dist.get(tier, 0) + 1
-
-        return ProvableConsensusData(
+        tier_dist = dict(
+            Counter(
+                _credibility_tier(source.credibility_score)
+                for result in results
+                for source in result.sources
+            )
+        )
+
+        # Built from engine outputs, so skip re-validation
+        return ProvableConsensusData.model_construct(
             consensus_reached=consensus.reached,
             outcome=consensus.outcome.value,
             confidence=consensus.confidence,
@@ -7,7 +7,7 @@ calculates consensus, and stores results.
 
 import asyncio
 import os
-import uuid
+import secrets
 from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from typing import Any
@@ -40,6 +40,8 @@ class OracleConfig(BaseModel):
     # Agent settings
     num_agents: int = Field(default=3, ge=1, le=10)
     agent_timeout_seconds: int = Field(default=300)
+    # Stop waiting on slow agents once their votes can no longer change the outcome
+    enable_early_exit: bool = Field(default=False)
 
     # Consensus settings (overridden in __init__ from env CONSENSUS_THRESHOLD)
     consensus_threshold: float = Field(default=0.66, ge=0.5, le=1.0)
@@ -94,6 +96,9 @@ class MultiAgentOracle:
             )
         )
 
+        # Running resolve() calls, keyed by their inputs
+        self._inflight: dict[tuple[str, str, int, str | None], asyncio.Task[OracleResult]] = {}
+
         # Initialize IPFS storage
         if self.config.enable_ipfs:
             self.ipfs_storage = ipfs_storage or IPFSStorage()
@@ -151,6 +156,16 @@ class MultiAgentOracle:
         """
         Resolve a prediction market question.
 
+        Concurrent calls for the same question, criteria, market and deadline
+        share one run. The caller that started it gets the OracleResult and
+        later callers get deep copies, so mutating one does not affect the
+        others. The run is a separate task, so a caller that is cancelled does
+        not cancel it for the others.
+
+        The API server does not go through this method; it coalesces requests
+        itself in _execute_resolution() around aresolve_stream(), so the two
+        layers never stack.
+
         Args:
             question: The question to resolve
             resolution_criteria: Criteria for determining the outcome
@@ -161,7 +176,60 @@ class MultiAgentOracle:
         Returns:
             OracleResult with consensus, sources, and IPFS hash
         """
-        request_id = f"req_{uuid.uuid4().hex[:12]}"
+        key = (question, resolution_criteria, market_id or 0, deadline)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._resolve_once(question, resolution_criteria, market_id, deadline)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            return await asyncio.shield(task)
+
+        logger.info("Joining in-flight resolution", question=question[:100])
+        result = await asyncio.shield(task)
+        return result.model_copy(deep=True)
+
+    async def _resolve_once(
+        self,
+        question: str,
+        resolution_criteria: str,
+        market_id: int | None,
+        deadline: str | None,
+    ) -> OracleResult:
+        """Run aresolve_stream() to completion and return its OracleResult."""
+        async for item in self.aresolve_stream(
+            question, resolution_criteria, market_id=market_id, deadline=deadline
+        ):
+            if isinstance(item, OracleResult):
+                return item
+        raise RuntimeError("Resolution stream ended without a result")
+
+    async def aresolve_stream(
+        self,
+        question: str,
+        resolution_criteria: str,
+        market_id: int | None = None,
+        deadline: str | None = None,
+    ) -> AsyncIterator[AgentResult | OracleResult]:
+        """
+        Resolve a prediction market question, yielding agent results as they settle.
+
+        A result is settled once it is valid, or once the retry loop has
+        stopped re-running it. Agent results are yielded in agent order, so
+        consumers see the same sequence as OracleResult.agent_results. The
+        final item is the OracleResult itself.
+
+        With OracleConfig.enable_early_exit, agents still running once the
+        consensus is decided are cancelled and left out of the results.
+
+        Args:
+            question: The question to resolve
+            resolution_criteria: Criteria for determining the outcome
+            market_id: Optional market ID for blockchain submission
+            deadline: Optional deadline for the question
+        """
+        request_id = f"req_{secrets.token_hex(6)}"
         market_id = market_id or 0
         started_at = datetime.now(timezone.utc).isoformat()
 
@@ -176,60 +244,116 @@ class MultiAgentOracle:
         retry_base_delay = float(os.getenv("AGENT_RETRY_BASE_DELAY", "2"))
         min_valid = self.consensus_engine.config.min_agents
 
-        agent_results = await self._run_agents(question, resolution_criteria, deadline)
+        agent_results: list[AgentResult | None] = [None] * len(self.agents)
+        next_index = 0
+        pending = {
+            asyncio.create_task(
+                self._run_agent(agent, question, resolution_criteria, deadline)
+            ): i
+            for i, agent in enumerate(self.agents)
+        }
 
-        for attempt in range(1, max_retries):
-            valid_count = sum(1 for r in agent_results if r.is_valid)
-            if valid_count >= min_valid:
-                if attempt > 1:
-                    logger.info(
-                        f"✅ Retry succeeded on attempt {attempt}/{max_retries}: {valid_count} valid agents"
+        try:
+            attempt = 1
+            while True:
+                while pending:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        agent_results[pending.pop(task)] = task.result()
+
+                    if (
+                        self.config.enable_early_exit
+                        and pending
+                        and self.consensus_engine.is_decided(
+                            [r for r in agent_results if r is not None], len(pending)
+                        )
+                    ):
+                        logger.info(
+                            "Consensus decided, cancelling remaining agents",
+                            cancelled=[self.agents[i].agent_id for i in pending.values()],
+                        )
+                        for task in pending:
+                            task.cancel()
+                        pending = {}
+                        # Cancelled agents are left out of the result
+                        agent_results = [r for r in agent_results if r is not None]
+
+                    # Valid results are never retried, so they can go out now
+                    while next_index < len(agent_results):
+                        agent_result = agent_results[next_index]
+                        if agent_result is None or not agent_result.is_valid:
+                            break
+                        yield agent_result
+                        next_index += 1
+
+                # Every agent has a result once nothing is pending
+                settled = [r for r in agent_results if r is not None]
+                valid_count = sum(1 for r in settled if r.is_valid)
+                logger.info(
+                    "Agent research completed",
+                    total=len(agent_results),
+                    successful=valid_count,
+                    failed=len(agent_results) - valid_count,
+                )
+                if valid_count >= min_valid:
+                    if attempt > 1:
+                        logger.info(
+                            f"✅ Retry succeeded on attempt {attempt}/{max_retries}: {valid_count} valid agents"
+                        )
+                    break
+                if attempt >= max_retries:
+                    logger.error(
+                        f"❌ All {max_retries} attempts exhausted. valid_agents={valid_count}/{len(agent_results)}. "
+                        f"Proceeding with best available results."
                     )
-                break
-
-            failed_indices = [i for i, r in enumerate(agent_results) if not r.is_valid]
-            failed_agents = [self.agents[i] for i in failed_indices]
-            failed_errors = [agent_results[i].error for i in failed_indices]
+                    break
 
-            delay = min(retry_base_delay * (2 ** (attempt - 1)), 30)
-            logger.warning(
-                f"⚠️ Attempt {attempt}/{max_retries}: only {valid_count}/{len(agent_results)} valid agents. "
-                f"Retrying {len(failed_agents)} failed agents in {delay:.0f}s... Errors: {failed_errors[:3]}"
-            )
-            await asyncio.sleep(delay)
+                failed_indices = [i for i, r in enumerate(settled) if not r.is_valid]
+                failed_errors = [settled[i].error for i in failed_indices]
 
-            retry_results = await self._run_agents_subset(
-                failed_agents, question, resolution_criteria, deadline
-            )
-            for idx, retry_result in zip(failed_indices, retry_results):
-                agent_results[idx] = retry_result
-        else:
-            valid_count = sum(1 for r in agent_results if r.is_valid)
-            if valid_count < min_valid:
-                logger.error(
-                    f"❌ All {max_retries} attempts exhausted. valid_agents={valid_count}/{len(agent_results)}. "
-                    f"Proceeding with best available results."
+                delay = min(retry_base_delay * (2 ** (attempt - 1)), 30)
+                logger.warning(
+                    f"⚠️ Attempt {attempt}/{max_retries}: only {valid_count}/{len(agent_results)} valid agents. "
+                    f"Retrying {len(failed_indices)} failed agents in {delay:.0f}s... Errors: {failed_errors[:3]}"
                 )
+                await asyncio.sleep(delay)
+
+                attempt += 1
+                pending = {
+                    asyncio.create_task(
+                        self._run_agent(
+                            self.agents[i], question, resolution_criteria, deadline, retry=True
+                        )
+                    ): i
+                    for i in failed_indices
+                }
+        finally:
+            for task in pending:
+                task.cancel()
+
+        # Whatever is left is final now that retries have stopped
+        for agent_result in settled[next_index:]:
+            yield agent_result
 
         # Calculate consensus from best attempt
-        consensus = self.consensus_engine.calculate(agent_results)
+        consensus = self.consensus_engine.calculate(settled)
 
         # Merge sources from agreeing agents
         if consensus.reached:
-            agreeing_results = [r for r in agent_results if r.outcome == consensus.outcome]
+            agreeing_results = [r for r in settled if r.outcome == consensus.outcome]
             merged_sources = self.consensus_engine._merge_sources(agreeing_results)
         else:
             merged_sources = []
 
         # Store on IPFS
         ipfs_cid = None
-        if self.ipfs_storage and (consensus.reached or len(agent_results) > 0):
+        if self.ipfs_storage and (consensus.reached or len(settled) > 0):
             try:
                 ipfs_cid = await self.ipfs_storage.store_research(
                     market_id=market_id,
                     question=question,
                     resolution_criteria=resolution_criteria,
-                    agent_results=agent_results,
+                    agent_results=settled,
                     consensus=consensus,
                     merged_sources=merged_sources,
                 )
@@ -243,7 +367,7 @@ class MultiAgentOracle:
             question=question,
             resolution_criteria=resolution_criteria,
             consensus=consensus,
-            agent_results=agent_results,
+            agent_results=settled,
             merged_sources=merged_sources,
             ipfs_cid=ipfs_cid,
             research_started_at=started_at,
@@ -260,7 +384,7 @@ class MultiAgentOracle:
             ipfs_cid=ipfs_cid,
         )
 
-        return result
+        yield result
 
     async def resolve_multi_outcome(
         self,
@@ -277,7 +401,7 @@ class MultiAgentOracle:
         Runs agents with multi-outcome prompts, then uses
         MultiOutcomeConsensusEngine for N+1 bin voting.
         """
-        request_id = f"req_{uuid.uuid4().hex[:12]}"
+        request_id = f"req_{secrets.token_hex(6)}"
         market_id = market_id or 0
         started_at = datetime.now(timezone.utc).isoformat()
 
@@ -655,101 +779,43 @@ class MultiAgentOracle:
         results = await asyncio.gather(*tasks)
         return list(results)
 
-    async def _run_agents(
+    async def _run_agent(
         self,
+        agent: BaseAgent,
         question: str,
         resolution_criteria: str,
         deadline: str | None = None,
-    ) -> list[AgentResult]:
-        """Run all agents in parallel and collect results."""
-
-        async def run_agent(agent: BaseAgent) -> AgentResult:
-            try:
-                return await asyncio.wait_for(
-                    agent.research(question, resolution_criteria, deadline),
-                    timeout=self.config.agent_timeout_seconds,
-                )
-            except TimeoutError:
-                logger.warning(f"Agent {agent.agent_id} timed out")
-                return AgentResult(
-                    agent_id=agent.agent_id,
-                    model=agent.model_name,
-                    outcome=Outcome.INVALID,
-                    confidence=0.0,
-                    reasoning="Research timed out",
-                    sources=[],
-                    error="Timeout",
-                )
-            except Exception as e:
-                logger.error(f"Agent {agent.agent_id} failed: {e}")
-                return AgentResult(
-                    agent_id=agent.agent_id,
-                    model=agent.model_name,
-                    outcome=Outcome.INVALID,
-                    confidence=0.0,
-                    reasoning="Research failed",
-                    sources=[],
-                    error=str(e),
-                )
-
-        # Run all agents in parallel
-        tasks = [run_agent(agent) for agent in self.agents]
-        results = await asyncio.gather(*tasks)
-
-        # Filter out completely failed results for logging
-        successful = [r for r in results if r.error is None]
-        failed = [r for r in results if r.error is not None]
-
-        logger.info(
-            "Agent research completed",
-            total=len(results),
-            successful=len(successful),
-            failed=len(failed),
-        )
-
-        return list(results)
-
-    async def _run_agents_subset(
-        self,
-        agents: list[BaseAgent],
-        question: str,
-        resolution_criteria: str,
-        deadline: str | None = None,
-    ) -> list[AgentResult]:
-        """Re-run a subset of agents (for retrying only failed agents)."""
-
-        async def run_agent(agent: BaseAgent) -> AgentResult:
-            try:
-                return await asyncio.wait_for(
-                    agent.research(question, resolution_criteria, deadline),
-                    timeout=self.config.agent_timeout_seconds,
-                )
-            except TimeoutError:
-                logger.warning(f"Agent {agent.agent_id} timed out (retry)")
-                return AgentResult(
-                    agent_id=agent.agent_id,
-                    model=agent.model_name,
-                    outcome=Outcome.INVALID,
-                    confidence=0.0,
-                    reasoning="Research timed out",
-                    sources=[],
-                    error="Timeout",
-                )
-            except Exception as e:
-                logger.error(f"Agent {agent.agent_id} failed (retry): {e}")
-                return AgentResult(
-                    agent_id=agent.agent_id,
-                    model=agent.model_name,
-                    outcome=Outcome.INVALID,
-                    confidence=0.0,
-                    reasoning="Research failed",
-                    sources=[],
-                    error=str(e),
-                )
-
-        tasks = [run_agent(agent) for agent in agents]
-        results = await asyncio.gather(*tasks)
-        return list(results)
+        retry: bool = False,
+    ) -> AgentResult:
+        """Run a single agent, turning timeouts and errors into INVALID results."""
+        suffix = " (retry)" if retry else ""
+        try:
+            return await asyncio.wait_for(
+                agent.research(question, resolution_criteria, deadline),
+                timeout=self.config.agent_timeout_seconds,
+            )
+        except TimeoutError:
+            logger.warning(f"Agent {agent.agent_id} timed out{suffix}")
+            return AgentResult(
+                agent_id=agent.agent_id,
+                model=agent.model_name,
+                outcome=Outcome.INVALID,
+                confidence=0.0,
+                reasoning="Research timed out",
+                sources=[],
+                error="Timeout",
+            )
+        except Exception as e:
+            logger.error(f"Agent {agent.agent_id} failed{suffix}: {e}")
+            return AgentResult(
+                agent_id=agent.agent_id,
+                model=agent.model_name,
+                outcome=Outcome.INVALID,
+                confidence=0.0,
+                reasoning="Research failed",
+                sources=[],
+                error=str(e),
+            )
 
     async def resolve_with_progress(
         self,
@@ -765,7 +831,7 @@ class MultiAgentOracle:
         Yields dict events suitable for SSE serialization. Final event has
         event_type="resolution:completed" or "resolution:error".
         """
-        request_id = request_id or f"req_{uuid.uuid4().hex[:12]}"
+        request_id = request_id or f"req_{secrets.token_hex(6)}"
         market_id = market_id or 0
         started_at = datetime.now(timezone.utc).isoformat()
 
@@ -937,7 +1003,7 @@ class MultiAgentOracle:
         """
         Resolve a multi-outcome prediction market question with SSE progress events.
         """
-        request_id = request_id or f"req_{uuid.uuid4().hex[:12]}"
+        request_id = request_id or f"req_{secrets.token_hex(6)}"
         market_id = market_id or 0
         started_at = datetime.now(timezone.utc).isoformat()
 
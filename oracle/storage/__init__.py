@@ -21,6 +21,7 @@ from oracle.storage.canonical import (
     calculate_data_hash,
     calculate_sha256,
     # Functions
+    to_canonical_bytes,
     to_canonical_json,
     verify_ipfs_data,
 )
@@ -32,6 +33,7 @@ __all__ = [
     "IPFSConfig",
     # Canonical JSON
     "to_canonical_json",
+    "to_canonical_bytes",
     "calculate_sha256",
     "calculate_data_hash",
     "verify_ipfs_data",
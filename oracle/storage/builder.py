@@ -305,7 +305,6 @@ class OracleResearchDataBuilder:
             market_id=self.market_id,
             agents=research_data.total_agents,
             sources=research_data.unique_sources,
-            hash=research_data.calculate_hash()[:16] + "...",
         )
 
         return research_data
@@ -348,6 +347,11 @@ class OracleResearchDataBuilder:
 
         return config
 
+    @property
+    def oracle_config_hash(self) -> str | None:
+        """SHA256 hash of the oracle config set via build_config()/set_oracle_config()."""
+        return self._oracle_config_hash
+
     @property
     def agent_count(self) -> int:
         """Get current agent count."""
@@ -14,11 +14,13 @@ Task ID: 2.7.1 - 2.7.8 from IMPLEMENTATION-TRACKER.md
 
 import hashlib
 import json
+import re
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
 from typing import Any
 
+import orjson
 import structlog
 from pydantic import BaseModel, Field
 
@@ -68,30 +70,86 @@ class CanonicalJSONEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
-def to_canonical_json(data: Any) -> str:
+_CANONICAL_ENCODER = CanonicalJSONEncoder()
+
+# Datetimes and dataclasses go through CanonicalJSONEncoder.default so orjson
+# and json.dumps see exactly the same values.
+_ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+# Number tokens where orjson's float formatting differs from json.dumps:
+# exponent notation ("1e16" vs "1e+16") and tiny values written out
+# positionally ("0.00001" vs "1e-05"). A match inside a string only costs a
+# fallback to the slow path. Top-level numbers are matched separately, as an
+# "^" alternative defeats the regex engine's prefix scan.
+_DIVERGENT_FLOAT_RE = re.compile(rb"[:,\[]-?(?:\d+(?:\.\d+)?e|0\.0000)")
+_DIVERGENT_TOP_LEVEL_RE = re.compile(rb"-?(?:\d+(?:\.\d+)?e|0\.0000)")
+
+# Values orjson encodes exactly like json.dumps, so they need no float scan
+# (integers are further limited to the 64-bit range orjson supports).
+_SCAN_FREE_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def to_canonical_bytes(data: Any) -> bytes:
     """
-    Convert data to canonical JSON string.
+    Convert data to canonical JSON as UTF-8 bytes.
 
-    Task 2.7.3: Implement to_canonical_json() function.
+    Prefer this over to_canonical_json() when the result is only hashed or
+    written out, as it skips the str round-trip.
+
+    Uses orjson where its output is byte-identical to the json.dumps
+    encoding that existing on-chain hashes were computed with, and falls
+    back to json.dumps otherwise (divergent floats, integers beyond 64 bits,
+    non-string keys).
+
+    Non-finite floats (NaN, Infinity) are not valid JSON under RFC 8785 and
+    must not be passed in; their encoding is unspecified.
 
     Args:
         data: Any JSON-serializable data
 
     Returns:
-        Canonical JSON string (deterministic, sorted keys, no whitespace)
+        Canonical JSON bytes (deterministic, sorted keys, no whitespace)
     """
     # If it's a Pydantic model, convert to dict first
     if isinstance(data, BaseModel):
         data = data.model_dump()
 
-    # Serialize with sorted keys and no extra whitespace
-    return json.dumps(
-        data,
-        cls=CanonicalJSONEncoder,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=False,
-    )
+    try:
+        encoded = orjson.dumps(data, default=_CANONICAL_ENCODER.default, option=_ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        encoded = None
+
+    if (
+        encoded is None
+        or _DIVERGENT_FLOAT_RE.search(encoded)
+        or _DIVERGENT_TOP_LEVEL_RE.match(encoded)
+    ):
+        return json.dumps(
+            data,
+            cls=CanonicalJSONEncoder,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+    return encoded
+
+
+def to_canonical_json(data: Any) -> str:
+    """
+    Convert data to canonical JSON string.
+
+    Task 2.7.3: Implement to_canonical_json() function.
+
+    Args:
+        data: Any JSON-serializable data
+
+    Returns:
+        Canonical JSON string (deterministic, sorted keys, no whitespace)
+    """
+    return to_canonical_bytes(data).decode("utf-8")
 
 
 def calculate_sha256(data: str | bytes) -> str:
@@ -122,9 +180,9 @@ def calculate_data_hash(data: Any) -> tuple[str, str]:
     Returns:
         Tuple of (canonical_json, sha256_hash)
     """
-    canonical = to_canonical_json(data)
+    canonical = to_canonical_bytes(data)
     hash_value = calculate_sha256(canonical)
-    return canonical, hash_value
+    return canonical.decode("utf-8"), hash_value
 
 
 class HashableData(BaseModel):
@@ -136,17 +194,21 @@ class HashableData(BaseModel):
 
     def to_canonical_json(self) -> str:
         """Convert to canonical JSON string."""
-        return to_canonical_json(self.model_dump())
+        return self.to_canonical_bytes().decode("utf-8")
+
+    def to_canonical_bytes(self) -> bytes:
+        """Convert to canonical JSON bytes."""
+        return to_canonical_bytes(self.model_dump())
 
     def calculate_hash(self) -> str:
         """Calculate SHA256 hash of canonical JSON."""
-        return calculate_sha256(self.to_canonical_json())
+        return calculate_sha256(self.to_canonical_bytes())
 
     def get_hash_data(self) -> tuple[str, str]:
         """Get both canonical JSON and hash."""
-        canonical = self.to_canonical_json()
+        canonical = self.to_canonical_bytes()
         hash_value = calculate_sha256(canonical)
-        return canonical, hash_value
+        return canonical.decode("utf-8"), hash_value
 
 
 class OracleConfigData(HashableData):
@@ -184,6 +246,32 @@ class OracleConfigData(HashableData):
     # Additional metadata
     metadata: dict = Field(default_factory=dict)
 
+    def to_canonical_bytes(self) -> bytes:
+        """
+        Convert to canonical JSON bytes.
+
+        The schema is fixed, so the object is emitted field by field in
+        sorted key order. Strings, bools and 64-bit integers are encoded
+        directly; only the float threshold, the free-form metadata and
+        anything unusual go through the float-checked to_canonical_bytes().
+        """
+        parts = []
+        for prefix, name in _CONFIG_CANONICAL_FIELDS:
+            value = getattr(self, name)
+            if type(value) in _SCAN_FREE_TYPES and (
+                type(value) is not int or -(2**63) <= value < 2**64
+            ):
+                parts.append(prefix + orjson.dumps(value))
+            else:
+                parts.append(prefix + to_canonical_bytes(value))
+        return b"{" + b",".join(parts) + b"}"
+
+
+# (b'"key":', key) pairs for OracleConfigData in canonical (sorted) order
+_CONFIG_CANONICAL_FIELDS = tuple(
+    (b'"%s":' % name.encode(), name) for name in sorted(OracleConfigData.model_fields)
+)
+
 
 class ResearchDataEntry(HashableData):
     """
@@ -318,8 +406,7 @@ def verify_ipfs_data(
         parsed = json.loads(json_data)
 
         # Calculate canonical form and hash
-        canonical = to_canonical_json(parsed)
-        actual_hash = calculate_sha256(canonical)
+        actual_hash = calculate_sha256(to_canonical_bytes(parsed))
 
         # Compare hashes
         is_valid = actual_hash == expected_hash
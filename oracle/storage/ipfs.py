@@ -13,6 +13,7 @@ from datetime import datetime, timezone
 
 import httpx
 import structlog
+from cachetools import LRUCache
 from pydantic import BaseModel, Field
 
 from oracle.models import (
@@ -80,6 +81,9 @@ class IPFSStorage:
 
         self.client = httpx.AsyncClient(timeout=self.config.timeout_seconds)
 
+        # CIDs produced by _mock_upload (recent ones only; used for ipfs_mock flags)
+        self._mock_cids: LRUCache[str, bool] = LRUCache(maxsize=4096)
+
         # Check if storacha CLI is available and configured
         self._storacha_cli_available = self._check_storacha_cli()
 
@@ -409,8 +413,13 @@ class IPFSStorage:
 
         logger.info(f"Mock IPFS: saved to {filepath}")
 
+        self._mock_cids[mock_cid] = True
         return mock_cid
 
+    def is_mock_cid(self, cid: str) -> bool:
+        """Check whether a CID was stored in local mock storage by this client."""
+        return cid in self._mock_cids
+
     def get_gateway_url(self, cid: str) -> str:
         """Get gateway URL for a CID."""
         return f"{self.config.gateway_url}/ipfs/{cid}"
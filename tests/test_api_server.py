@@ -0,0 +1,427 @@
+"""
+Tests for API server helpers.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from oracle.api import server
+from oracle.api.server import ResolutionRequest, ResultResponse, ResultStore
+from oracle.storage import calculate_sha256, to_canonical_bytes
+
+
+class TestResolutionCoalescing:
+    """Tests for in-flight deduplication in _execute_resolution()."""
+
+    async def test_identical_requests_share_one_run(self, monkeypatch):
+        """Concurrent identical requests run once and keep their own request IDs."""
+        calls = 0
+
+        async def fake_resolution(request_id, request):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return ResultResponse(
+                request_id=request_id, market_id=request.market_id, status="completed"
+            )
+
+        monkeypatch.setattr(server, "_execute_verified_resolution", fake_resolution)
+
+        request = ResolutionRequest(market_id=1, question="Q?", resolution_criteria="C")
+        with_callback = request.model_copy(update={"callback_url": "https://example.com/hook"})
+
+        results = await asyncio.gather(
+            server._execute_resolution("req_a", request),
+            server._execute_resolution("req_b", with_callback),
+        )
+
+        assert calls == 1
+        assert [r.request_id for r in results] == ["req_a", "req_b"]
+        assert not server._inflight_resolutions
+
+    async def test_different_requests_run_separately(self, monkeypatch):
+        """Requests for different questions are not coalesced."""
+        calls = 0
+
+        async def fake_resolution(request_id, request):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return ResultResponse(
+                request_id=request_id, market_id=request.market_id, status="completed"
+            )
+
+        monkeypatch.setattr(server, "_execute_verified_resolution", fake_resolution)
+
+        await asyncio.gather(
+            server._execute_resolution(
+                "req_a", ResolutionRequest(market_id=1, question="Q1?", resolution_criteria="C")
+            ),
+            server._execute_resolution(
+                "req_b", ResolutionRequest(market_id=1, question="Q2?", resolution_criteria="C")
+            ),
+        )
+
+        assert calls == 2
+
+    async def test_completed_results_are_cached_within_ttl(self, monkeypatch):
+        """With RESOLVE_CACHE_TTL set, a repeated request reuses the completed result."""
+        calls = 0
+        now = 0.0
+
+        async def fake_resolution(request_id, request):
+            nonlocal calls
+            calls += 1
+            return ResultResponse(
+                request_id=request_id, market_id=request.market_id, status="completed"
+            )
+
+        cache = server.TLRUCache(maxsize=8, ttu=server._resolution_expiry, timer=lambda: now)
+        monkeypatch.setattr(server, "_execute_verified_resolution", fake_resolution)
+        monkeypatch.setattr(server, "_resolution_cache", cache)
+        monkeypatch.setattr(server, "get_settings", lambda: server.Settings(resolve_cache_ttl=60))
+
+        request = ResolutionRequest(market_id=1, question="Q?", resolution_criteria="C")
+        first = await server._execute_resolution("req_a", request)
+        now = 59.0
+        second = await server._execute_resolution("req_b", request)
+
+        assert calls == 1
+        assert (first.request_id, second.request_id) == ("req_a", "req_b")
+
+        # Past the TTL the entry is dropped and the request runs again
+        now = 61.0
+        assert len(cache) == 0
+        await server._execute_resolution("req_c", request)
+        assert calls == 2
+
+    async def test_runs_are_limited_by_resolution_slots(self, monkeypatch):
+        """Distinct runs queue once all resolution slots are taken."""
+        running = peak = 0
+
+        async def fake_resolution(request_id, request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return ResultResponse(
+                request_id=request_id, market_id=request.market_id, status="completed"
+            )
+
+        monkeypatch.setattr(server, "_execute_verified_resolution", fake_resolution)
+        monkeypatch.setattr(server.api_instance, "resolution_slots", asyncio.Semaphore(1))
+
+        await asyncio.gather(
+            *(
+                server._execute_resolution(
+                    f"req_{i}",
+                    ResolutionRequest(market_id=1, question=f"Q{i}?", resolution_criteria="C"),
+                )
+                for i in range(3)
+            )
+        )
+
+        assert peak == 1
+
+
+class TestRequestResolution:
+    """Tests for POST /api/v1/resolve."""
+
+    async def test_runs_resolution_after_responding(self, monkeypatch):
+        """The request is marked processing and resolved in the background."""
+        ran = []
+
+        async def fake_run(request_id, request):
+            ran.append((request_id, request.market_id))
+
+        store = ResultStore()
+        monkeypatch.setattr(server, "_run_resolution", fake_run)
+        monkeypatch.setattr(server.api_instance, "oracle", object())
+        monkeypatch.setattr(server.api_instance, "result_store", store)
+
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post(
+                "/api/v1/resolve",
+                json={"market_id": 3, "question": "Q?", "resolution_criteria": "C"},
+            )
+
+        body = response.json()
+        assert body["status"] == "processing"
+        assert ran == [(body["request_id"], 3)]
+        assert (await store.get(body["request_id"]))[0] == "processing"
+
+
+class TestResultStoreWait:
+    """Tests for ResultStore.wait()."""
+
+    async def test_wakes_on_completion(self):
+        """A waiter returns as soon as the request completes."""
+        store = ResultStore()
+        await store.set_processing("req_a")
+
+        waiter = asyncio.create_task(store.wait("req_a", timeout=5))
+        await asyncio.sleep(0)
+        await store.set_completed(
+            "req_a", ResultResponse(request_id="req_a", market_id=1, status="completed")
+        )
+
+        assert await asyncio.wait_for(waiter, timeout=1) is True
+        assert (await store.get("req_a"))[0] == "completed"
+
+    async def test_times_out_while_processing(self):
+        """wait() reports False if the request is still processing."""
+        store = ResultStore()
+        await store.set_processing("req_a")
+
+        assert await store.wait("req_a", timeout=0.01) is False
+
+    async def test_finished_or_unknown_requests_return_immediately(self):
+        """Nothing to wait for once a request has finished, or if it never existed."""
+        store = ResultStore()
+        await store.set_processing("req_a")
+        await store.set_failed("req_a", "boom")
+
+        assert await store.wait("req_a", timeout=0) is True
+        assert await store.wait("req_missing", timeout=0) is True
+
+
+class TestRedisResultStoreGet:
+    """Tests for RedisResultStore.get() status decoding."""
+
+    async def _get(self, status, error=None):
+        async def mget(*keys):
+            return status, None, error
+
+        store = server.RedisResultStore("redis://localhost:6379/0")
+        store._redis = SimpleNamespace(mget=mget)
+        return await store.get("req_a")
+
+    async def test_current_statuses(self):
+        """Statuses written by this version decode as-is."""
+        assert await self._get(b"processing") == ("processing", None, None)
+        assert await self._get(b"failed", b"boom") == ("failed", None, "boom")
+
+    async def test_legacy_failed_status(self):
+        """'failed: <error>' values from older workers map to FAILED plus the error."""
+        assert await self._get(b"failed: upstream timeout") == (
+            "failed",
+            None,
+            "upstream timeout",
+        )
+
+    async def test_unknown_status(self):
+        """An unrecognized value is reported as a failure instead of raising."""
+        status, _, error = await self._get(b"exploded")
+
+        assert status == "failed"
+        assert error == "Unrecognized status: exploded"
+
+
+class TestGetResultLongPoll:
+    """Tests for GET /api/v1/result/{request_id}?wait=."""
+
+    async def _get(self, monkeypatch, store, **params):
+        monkeypatch.setattr(server.api_instance, "result_store", store)
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/api/v1/result/req_a", params=params)
+        return response.json()
+
+    async def test_wait_returns_once_completed(self, monkeypatch):
+        """A long-poll returns the result as soon as the request completes."""
+        store = ResultStore()
+        await store.set_processing("req_a")
+
+        async def complete():
+            await asyncio.sleep(0.01)
+            await store.set_completed(
+                "req_a", ResultResponse(request_id="req_a", market_id=7, status="completed")
+            )
+
+        completer = asyncio.create_task(complete())
+        body = await self._get(monkeypatch, store, wait=5)
+        await completer
+
+        assert body["status"] == "completed"
+        assert body["market_id"] == 7
+
+    async def test_wait_times_out_as_processing(self, monkeypatch):
+        """A long-poll that times out reports the request as still processing."""
+        store = ResultStore()
+        await store.set_processing("req_a")
+
+        body = await self._get(monkeypatch, store, wait=0.01)
+
+        assert body["status"] == "processing"
+
+    async def test_multi_outcome_result_keeps_its_fields(self, monkeypatch):
+        """Stored multi-outcome results are returned in full, without None fields."""
+        store = ResultStore()
+        await store.set_completed(
+            "req_a",
+            server.MultiOutcomeResultResponse(
+                request_id="req_a", market_id=7, status="completed", outcome_index=2
+            ),
+        )
+
+        body = await self._get(monkeypatch, store)
+
+        assert body["market_id"] == 7
+        assert body["outcome_index"] == 2
+        assert "outcome_label" not in body
+
+    async def test_processing_request_uses_result_shape(self, monkeypatch):
+        """In-flight requests return the documented ResultResponse subset."""
+        store = ResultStore()
+        await store.set_processing("req_a")
+
+        body = await self._get(monkeypatch, store)
+
+        assert body == {
+            "request_id": "req_a",
+            "market_id": 0,
+            "status": "processing",
+            "ipfs_mock": False,
+        }
+
+    async def test_failed_request_reports_error(self, monkeypatch):
+        """The stored error is returned verbatim, even if it contains a status prefix."""
+        store = ResultStore()
+        await store.set_processing("req_a")
+        await store.set_failed("req_a", "failed: upstream timeout")
+
+        body = await self._get(monkeypatch, store)
+
+        assert body["status"] == "failed"
+        assert body["error"] == "failed: upstream timeout"
+
+
+class TestGetOracleConfig:
+    """Tests for GET /api/v1/config/{cid}."""
+
+    CONFIG = {"market_id": 1, "question": "Q?", "agent_strategies": ["comprehensive"]}
+
+    async def _get(self, monkeypatch, cid, **params):
+        """GET the config twice, returning both bodies and the CIDs fetched from IPFS."""
+        fetches = []
+
+        async def fetch(fetched_cid):
+            fetches.append(fetched_cid)
+            return self.CONFIG
+
+        ipfs = SimpleNamespace(fetch=fetch)
+        monkeypatch.setattr(server.api_instance, "get_ipfs", lambda: ipfs)
+        monkeypatch.setattr(server, "_config_cache", server.LRUCache(maxsize=8))
+
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.get(f"/api/v1/config/{cid}", params=params)
+            second = await client.get(f"/api/v1/config/{cid}", params=params)
+        return first.json(), second.json(), fetches
+
+    async def test_plain_fetch_skips_verification(self, monkeypatch):
+        """Without expected_hash nothing is hashed and the fetch is cached."""
+        first, second, fetches = await self._get(monkeypatch, "bafyplain")
+
+        assert first["config"] == self.CONFIG
+        assert first["verified"] is None
+        assert first["actual_hash"] is None
+        assert second == first
+        assert fetches == ["bafyplain"]
+
+    async def test_verifies_expected_hash(self, monkeypatch):
+        """A matching expected_hash verifies; a different one does not."""
+        good = calculate_sha256(to_canonical_bytes(self.CONFIG))
+
+        first, _, _ = await self._get(monkeypatch, "bafygood", expected_hash=good)
+        bad, _, _ = await self._get(monkeypatch, "bafybad", expected_hash="0" * 64)
+
+        assert first["verified"] is True
+        assert first["actual_hash"] == good
+        assert bad["verified"] is False
+        assert bad["actual_hash"] == good
+
+
+class TestResultStoreBackend:
+    """Tests for Settings.result_store_backend."""
+
+    def test_defaults_follow_redis_url(self, monkeypatch):
+        """Memory by default; Redis once REDIS_URL is configured."""
+        monkeypatch.delenv("ORACLE_STORE", raising=False)
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        assert server.Settings().result_store_backend == "memory"
+
+        monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+        assert server.Settings().result_store_backend == "redis"
+
+    def test_explicit_backend_wins(self, monkeypatch):
+        """ORACLE_STORE overrides the REDIS_URL default."""
+        monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+        monkeypatch.setenv("ORACLE_STORE", "memory")
+        assert server.Settings().result_store_backend == "memory"
+
+    def test_backend_name_is_normalized(self, monkeypatch):
+        """ORACLE_STORE is matched case-insensitively, ignoring padding."""
+        monkeypatch.setenv("ORACLE_STORE", "  Redis ")
+        assert server.Settings().result_store_backend == "redis"
+
+        monkeypatch.setenv("ORACLE_STORE", "MEMORY")
+        assert server.Settings().result_store_backend == "memory"
+
+
+class TestSettings:
+    """Tests for Settings parsing."""
+
+    def test_workers_fall_back_to_web_concurrency(self, monkeypatch):
+        """API_WORKERS wins over WEB_CONCURRENCY; explicit values win over both."""
+        monkeypatch.delenv("API_WORKERS", raising=False)
+        monkeypatch.setenv("WEB_CONCURRENCY", "3")
+        assert server.Settings().api_workers == 3
+
+        monkeypatch.setenv("API_WORKERS", "2")
+        assert server.Settings().api_workers == 2
+        assert server.Settings(api_workers=5).api_workers == 5
+
+    def test_resolution_limit_must_be_positive(self, monkeypatch):
+        """MAX_CONCURRENT_RESOLUTIONS=0 would block every resolution, so it is rejected."""
+        monkeypatch.setenv("MAX_CONCURRENT_RESOLUTIONS", "0")
+        with pytest.raises(ValidationError):
+            server.Settings()
+
+    def test_webhook_workers_must_be_positive(self, monkeypatch):
+        """WEBHOOK_WORKERS=0 would leave queued webhooks undelivered, so it is rejected."""
+        monkeypatch.setenv("WEBHOOK_WORKERS", "0")
+        with pytest.raises(ValidationError):
+            server.Settings()
+
+
+class TestWebhookQueue:
+    """Tests for OracleAPI.enqueue_webhook()."""
+
+    async def test_webhooks_are_delivered_by_workers(self, monkeypatch):
+        """Queued webhooks are sent by the workers and drained on shutdown."""
+        sent = []
+
+        async def fake_send(url, body):
+            sent.append((url, orjson.loads(body)["request_id"]))
+
+        monkeypatch.setattr(server, "_send_webhook", fake_send)
+        monkeypatch.setattr(server, "get_settings", lambda: server.Settings(webhook_workers=2))
+
+        api = server.OracleAPI()
+        for i in range(3):
+            api.enqueue_webhook(
+                "https://example.com/hook",
+                ResultResponse(request_id=f"req_{i}", market_id=1, status="completed"),
+            )
+        await api.shutdown()
+
+        assert sorted(sent) == [("https://example.com/hook", f"req_{i}") for i in range(3)]
+        assert all(worker.done() for worker in api._webhook_workers)
@@ -0,0 +1,90 @@
+"""
+Tests for canonical JSON serialization and hashing.
+
+Hashes of canonical JSON are committed on-chain, so the output must stay
+byte-identical to the original json.dumps-based encoding.
+"""
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from oracle.storage.canonical import (
+    CanonicalJSONEncoder,
+    OracleConfigData,
+    calculate_sha256,
+    to_canonical_json,
+)
+
+
+def _reference_json(data) -> str:
+    """The json.dumps encoding existing hashes were computed with."""
+    return json.dumps(
+        data,
+        cls=CanonicalJSONEncoder,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+class TestCanonicalJSON:
+    """Tests for to_canonical_json()."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"b": 1, "a": [True, None, False], "é": "中文", "c": 'tab\tquote"\x00'},
+            {"tiny": 1e-05, "small": 0.0001, "neg_tiny": -3.2e-07},
+            {"big": 1e16, "huge": 1.7976931348623157e308, "below": 1e15},
+            [0.1 + 0.2, 1 / 3, -0.0, 5e-324],
+            1e16,
+            {"int": 2**63 - 1, "bigint": 2**80},
+            {1: "a", 2: "b"},
+            {"when": datetime(2025, 1, 1, 12, 0, 0, 123, tzinfo=UTC), "tags": {"b", "a"}},
+        ],
+    )
+    def test_matches_reference_encoding(self, value):
+        """Output is byte-identical to the json.dumps reference encoding."""
+        assert to_canonical_json(value) == _reference_json(value)
+
+    def test_config_hash_is_stable(self):
+        """OracleConfigData hashes match the reference encoding."""
+        config = OracleConfigData(
+            market_id=42,
+            question="Will BTC close above $100k on 2025-12-31?",
+            resolution_criteria="Coinbase BTC-USD daily close",
+            created_at="2025-01-01T00:00:00+00:00",
+            agent_count=3,
+            agent_strategies=["comprehensive", "focused_official", "news_centric"],
+            consensus_threshold=0.66,
+            min_sources_per_agent=3,
+            min_source_categories=2,
+            metadata={"trusted_sources": ["coinbase.com"]},
+        )
+
+        canonical, hash_value = config.get_hash_data()
+
+        assert canonical == _reference_json(config.model_dump())
+        assert hash_value == calculate_sha256(canonical)
+        assert config.to_canonical_bytes() == canonical.encode("utf-8")
+        assert config.calculate_hash() == hash_value
+
+    def test_config_hash_with_unusual_values(self):
+        """Field-by-field encoding falls back correctly for floats and big ints."""
+        config = OracleConfigData(
+            market_id=2**70,
+            question='Ünïcode   "quoted"\n',
+            resolution_criteria="C",
+            deadline="2025-12-31",
+            agent_count=3,
+            agent_strategies=["comprehensive"],
+            consensus_threshold=1e-05,
+            min_sources_per_agent=3,
+            min_source_categories=2,
+            require_tier1_sources=False,
+            metadata={"weights": [1e16, 0.5], "nested": {"b": None, "a": -(2**63)}},
+        )
+
+        assert config.to_canonical_json() == _reference_json(config.model_dump())
@@ -21,6 +21,8 @@ class TestConsensusEngine:
         assert result.outcome == Outcome.YES
         assert result.agreement_ratio == 1.0
         assert result.agent_count == 3
+        assert result.unique_sources == len(engine._merge_sources(sample_agent_results))
+        assert result.source_overlap == engine._calculate_source_overlap(sample_agent_results)
 
     def test_consensus_with_supermajority(self, sample_sources):
         """Test consensus with 2/3 majority."""
@@ -104,6 +106,15 @@ class TestConsensusEngine:
         assert result.outcome == Outcome.INVALID
         assert "Need 5+ agents" in result.reason
 
+    def test_source_quality_diversity_bonus(self, sample_sources):
+        """Any cited category earns the full 0.2 diversity bonus, capped at 1.0."""
+        engine = ConsensusEngine()
+        weak = [s.model_copy(update={"credibility_score": 0.5}) for s in sample_sources[:4]]
+
+        assert engine._calculate_source_quality([]) == 0.0
+        assert engine._calculate_source_quality(weak) == pytest.approx(0.7)
+        assert engine._calculate_source_quality(sample_sources) == 1.0
+
     def test_source_merging(self, sample_sources):
         """Test that sources are properly merged and deduplicated."""
         # Create results with overlapping sources
@@ -144,6 +155,11 @@ class TestConsensusEngine:
         multi_cited = [s for s in merged if len(s.cited_by) > 1]
         assert len(multi_cited) > 0
 
+        # Each URL keeps every citing agent exactly once
+        by_url = {s.url: s for s in merged}
+        assert by_url[sample_sources[25].url].cited_by == ["agent-1", "agent-2", "agent-3"]
+        assert by_url[sample_sources[5].url].cited_by == ["agent-1"]
+
     def test_source_overlap_calculation(self, sample_sources):
         """Test source overlap calculation."""
         # Create results with known overlap
@@ -171,3 +187,25 @@ class TestConsensusEngine:
 
         # Should be 100% overlap
         assert overlap == 1.0
+
+    def test_is_decided_assumes_pending_votes_oppose(self, sample_sources):
+        """Consensus is only decided once full-weight opposing votes cannot undo it."""
+
+        def vote(outcome):
+            return AgentResult(
+                agent_id=f"agent-{outcome.value}",
+                model="gemini",
+                outcome=outcome,
+                confidence=0.9,
+                reasoning=outcome.value,
+                sources=sample_sources[:10],
+            )
+
+        engine = ConsensusEngine(ConsensusConfig(threshold=0.66, min_agents=2))
+        two_yes = [vote(Outcome.YES), vote(Outcome.YES)]
+
+        assert engine.is_decided(two_yes, pending=0) is True
+        assert engine.is_decided(two_yes, pending=1) is False  # 1.8 / 2.8 < 0.66
+        assert engine.is_decided([*two_yes, vote(Outcome.YES)], pending=1) is True
+        assert engine.is_decided(two_yes[:1], pending=0) is False  # below min_agents
+        assert engine.is_decided([vote(Outcome.UNDETERMINED)] * 2, pending=0) is False
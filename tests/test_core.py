@@ -0,0 +1,121 @@
+"""
+Tests for MultiAgentOracle orchestration.
+"""
+
+import asyncio
+
+from oracle.agents.base import BaseAgent
+from oracle.consensus import ConsensusConfig, ConsensusEngine
+from oracle.core import MultiAgentOracle, OracleConfig
+from oracle.models import AgentResult, OracleResult, Outcome
+
+
+class FakeAgent(BaseAgent):
+    """Agent that returns canned results after a delay."""
+
+    def __init__(self, agent_id, delay, outcomes, sources):
+        super().__init__(agent_id=agent_id)
+        self.delay = delay
+        self.outcomes = list(outcomes)
+        self.sources = sources
+        self.calls = 0
+
+    @property
+    def model_name(self) -> str:
+        return "fake"
+
+    async def research(self, question, resolution_criteria, deadline=None, progress_callback=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        outcome = self.outcomes.pop(0)
+        if outcome is None:
+            raise RuntimeError("boom")
+        return AgentResult(
+            agent_id=self.agent_id,
+            model=self.model_name,
+            outcome=outcome,
+            confidence=0.9,
+            reasoning="fake",
+            sources=self.sources,
+        )
+
+
+def _oracle(agents, min_agents=2):
+    return MultiAgentOracle(
+        agents=agents,
+        config=OracleConfig(enable_ipfs=False),
+        consensus_engine=ConsensusEngine(ConsensusConfig(min_agents=min_agents)),
+    )
+
+
+class TestResolveStream:
+    """Tests for MultiAgentOracle.aresolve_stream()."""
+
+    async def test_yields_agent_results_in_order_then_result(self, sample_sources):
+        """Agent results come out in agent order, followed by the OracleResult."""
+        agents = [
+            FakeAgent("slow", 0.03, [Outcome.YES], sample_sources),
+            FakeAgent("fast", 0.0, [Outcome.YES], sample_sources),
+            FakeAgent("mid", 0.01, [Outcome.YES], sample_sources),
+        ]
+
+        items = [item async for item in _oracle(agents).aresolve_stream("Q?", "C")]
+
+        assert [i.agent_id for i in items[:-1]] == ["slow", "fast", "mid"]
+        assert isinstance(items[-1], OracleResult)
+        assert items[-1].agent_results == items[:-1]
+        assert items[-1].consensus.reached
+
+    async def test_failed_agents_are_retried_before_yielding(self, monkeypatch, sample_sources):
+        """Only the settled result of a retried agent is yielded."""
+        monkeypatch.setenv("AGENT_RETRY_BASE_DELAY", "0")
+        flaky = FakeAgent("flaky", 0.0, [None, Outcome.YES], sample_sources)
+        agents = [flaky, FakeAgent("ok", 0.0, [Outcome.YES], sample_sources)]
+
+        result = await _oracle(agents).resolve("Q?", "C")
+
+        assert flaky.calls == 2
+        assert [r.agent_id for r in result.agent_results] == ["flaky", "ok"]
+        assert all(r.is_valid for r in result.agent_results)
+
+    async def test_early_exit_cancels_agents_once_decided(self, sample_sources):
+        """With early exit on, a decided vote stops waiting on the slowest agent."""
+        agents = [
+            FakeAgent("a", 0.0, [Outcome.YES], sample_sources),
+            FakeAgent("slow", 5.0, [Outcome.NO], sample_sources),
+            FakeAgent("b", 0.0, [Outcome.YES], sample_sources),
+            FakeAgent("c", 0.01, [Outcome.YES], sample_sources),
+        ]
+        oracle = _oracle(agents)
+        oracle.config.enable_early_exit = True
+
+        result = await asyncio.wait_for(oracle.resolve("Q?", "C"), timeout=1)
+
+        assert [r.agent_id for r in result.agent_results] == ["a", "b", "c"]
+        assert result.consensus.reached
+        assert result.consensus.outcome == Outcome.YES
+
+
+class TestResolve:
+    """Tests for MultiAgentOracle.resolve()."""
+
+    async def test_concurrent_identical_calls_share_one_run(self, sample_sources):
+        """Identical concurrent calls run the agents once; different ones do not."""
+        agents = [
+            FakeAgent("a", 0.01, [Outcome.YES, Outcome.YES], sample_sources),
+            FakeAgent("b", 0.01, [Outcome.YES, Outcome.YES], sample_sources),
+        ]
+        oracle = _oracle(agents)
+
+        first, second, other = await asyncio.gather(
+            oracle.resolve("Q?", "C", market_id=1),
+            oracle.resolve("Q?", "C", market_id=1),
+            oracle.resolve("Q?", "C", market_id=2),
+        )
+
+        assert [agent.calls for agent in agents] == [2, 2]
+        assert second == first
+        assert second is not first
+        assert second.agent_results[0] is not first.agent_results[0]
+        assert other.request_id != first.request_id
+        assert not oracle._inflight
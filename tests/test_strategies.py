@@ -0,0 +1,64 @@
+"""
+Tests for agent strategy profiles and the StrategyFactory.
+"""
+
+from oracle.agents.strategies import StrategyFactory, StrategyProfile
+
+
+class TestRecommendedProfiles:
+    """Tests for StrategyFactory.get_recommended_profiles()."""
+
+    def test_zero_agents(self):
+        """No profiles are recommended for a non-positive agent count."""
+        assert StrategyFactory.get_recommended_profiles(0) == []
+        assert StrategyFactory.get_recommended_profiles(-1) == []
+
+    def test_prefix_of_recommended(self):
+        """Small agent counts take a prefix of the recommended list."""
+        profiles = StrategyFactory.get_recommended_profiles(3)
+
+        assert profiles == [
+            StrategyProfile.COMPREHENSIVE,
+            StrategyProfile.FOCUSED_OFFICIAL,
+            StrategyProfile.NEWS_CENTRIC,
+        ]
+
+    def test_cycles_when_more_agents_than_profiles(self):
+        """Larger agent counts cycle through the recommended list."""
+        base = StrategyFactory.get_recommended_profiles(7)
+        profiles = StrategyFactory.get_recommended_profiles(16)
+
+        assert len(profiles) == 16
+        assert profiles[:7] == base
+        assert profiles[7:14] == base
+        assert profiles[14:] == base[:2]
+
+    def test_strategy_names_match_profiles(self):
+        """Cached strategy names mirror get_recommended_profiles()."""
+        names = StrategyFactory.get_recommended_strategy_names(9)
+        names.append("mutated")
+
+        assert StrategyFactory.get_recommended_strategy_names(9) == [
+            p.value for p in StrategyFactory.get_recommended_profiles(9)
+        ]
+
+
+class TestStrategyConfigDomains:
+    """Tests for the preferred/excluded domain tables on StrategyConfig."""
+
+    def test_shared_domains_are_interned(self):
+        """Domains listed by several profiles resolve to the same string object."""
+        news = StrategyFactory.get_config(StrategyProfile.NEWS_CENTRIC)
+        crypto = StrategyFactory.get_config(StrategyProfile.CRYPTO_FINANCIAL)
+
+        news_bloomberg = next(d for d in news.preferred_domains if d == "bloomberg.com")
+        crypto_bloomberg = next(d for d in crypto.preferred_domains if d == "bloomberg.com")
+        assert news_bloomberg is crypto_bloomberg
+
+    def test_domains_are_tuples(self):
+        """Domain lists are stored as immutable tuples."""
+        config = StrategyFactory.get_config(StrategyProfile.ACADEMIC)
+
+        assert isinstance(config.preferred_domains, tuple)
+        assert "arxiv.org" in config.preferred_domains
+        assert isinstance(config.excluded_domains, tuple)
@@ -0,0 +1,192 @@
+"""
+Tests for the Strict Consensus Engine.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from oracle.consensus import StrictConsensusConfig, StrictConsensusEngine
+from oracle.consensus.strict_engine import _credibility_tier
+from oracle.models import AgentResult, Outcome, ResearchSource, SourceCategory
+
+
+def _source(url, category, credibility):
+    return ResearchSource(
+        url=url,
+        title=url,
+        category=category,
+        relevance_score=0.8,
+        credibility_score=credibility,
+    )
+
+
+def _result(agent_id, outcome, confidence, sources):
+    return AgentResult(
+        agent_id=agent_id,
+        model="gemini",
+        outcome=outcome,
+        confidence=confidence,
+        reasoning=outcome.value,
+        sources=sources,
+    )
+
+
+def _mixed_results():
+    """Three YES agents and one NO agent over sources spanning every tier."""
+    shared = [
+        _source("https://example.gov/a", SourceCategory.OFFICIAL, 0.8),
+        _source("https://reuters.com/b", SourceCategory.NEWS, 0.95),
+        _source("https://blog.example/c", SourceCategory.SOCIAL, 0.4),
+    ]
+    extra = [
+        _source("https://snopes.com/d", SourceCategory.FACT_CHECK, 0.9),
+        _source("https://forum.example/e", SourceCategory.SOCIAL, 0.6),
+        _source("https://industry.example/f", SourceCategory.DOMAIN_SPECIFIC, 0.7),
+    ]
+    return [
+        _result("agent-1", Outcome.YES, 0.9, shared + extra[:1]),
+        _result("agent-2", Outcome.YES, 0.85, shared + extra[1:2]),
+        _result("agent-3", Outcome.YES, 0.8, shared[:2] + extra[2:]),
+        _result("agent-4", Outcome.NO, 0.5, shared[1:] + extra[:1]),
+    ]
+
+
+class TestCredibilityTier:
+    """Tests for _credibility_tier()."""
+
+    @pytest.mark.parametrize(
+        ("score", "tier"),
+        [
+            (0.0, "tier_4_5"),
+            (0.49, "tier_4_5"),
+            (0.5, "tier_3"),
+            (0.7, "tier_2"),
+            (0.89, "tier_2"),
+            (0.9, "tier_1"),
+            (1.0, "tier_1"),
+        ],
+    )
+    def test_tier_edges(self, score, tier):
+        """Each tier includes its lower bound."""
+        assert _credibility_tier(score) == tier
+
+
+class TestVerifySources:
+    """Tests for StrictConsensusEngine._verify_sources()."""
+
+    def test_counts(self):
+        """Tier, uniqueness and cross-verification counts over all agents."""
+        engine = StrictConsensusEngine()
+
+        verification = engine._verify_sources(_mixed_results())
+
+        assert verification.total_sources == 14
+        assert verification.unique_sources == 6
+        assert verification.tier1_sources == 9
+        assert verification.tier2_sources == 8
+        assert verification.cross_verified_facts == 4
+        assert sorted(verification.source_categories) == [
+            "domain_specific",
+            "fact_check",
+            "news",
+            "official",
+            "social",
+        ]
+
+    def test_cross_verification_counts_distinct_agents(self):
+        """A URL repeated by one agent is not cross-verified."""
+        official = _source("https://example.gov/a", SourceCategory.OFFICIAL, 0.8)
+        news = _source("https://reuters.com/b", SourceCategory.NEWS, 0.95)
+        results = [
+            _result("agent-1", Outcome.YES, 0.9, [official, official, news]),
+            _result("agent-2", Outcome.YES, 0.9, [news]),
+            _result("agent-3", Outcome.YES, 0.9, []),
+        ]
+
+        verification = StrictConsensusEngine()._verify_sources(results)
+
+        assert verification.total_sources == 4
+        assert verification.unique_sources == 2
+        assert verification.cross_verified_facts == 1
+
+    def test_too_few_agents_fails_without_counting(self):
+        """Fewer results than min_agents fail verification with empty counts."""
+        engine = StrictConsensusEngine(StrictConsensusConfig(min_agents=5))
+
+        verification = engine._verify_sources(_mixed_results())
+
+        assert not verification.passed
+        assert verification.issues == ["Insufficient agents: 4/5"]
+        assert verification.total_sources == 0
+        assert verification.source_categories == []
+
+
+class TestAnalyzeDisagreement:
+    """Tests for StrictConsensusEngine._analyze_disagreement_detailed()."""
+
+    def test_agreement_skips_detailed_analysis(self):
+        """Unanimous results with a tight spread only carry the distribution and stats."""
+        results = _mixed_results()[:3]
+
+        analysis = StrictConsensusEngine()._analyze_disagreement_detailed(results)
+
+        assert analysis.has_disagreement is False
+        assert analysis.outcome_distribution == {"YES": 3}
+        assert analysis.confidence_stats["spread"] == pytest.approx(0.1)
+        assert analysis.source_overlap_by_outcome == {}
+        assert analysis.requires_manual_review is False
+
+    def test_agreement_with_high_spread_is_flagged(self):
+        """A wide confidence spread still gets factors and a review flag."""
+        results = _mixed_results()[:3]
+        results[2] = results[2].model_copy(update={"confidence": 0.4})
+
+        analysis = StrictConsensusEngine()._analyze_disagreement_detailed(results)
+
+        assert analysis.has_disagreement is False
+        assert analysis.contributing_factors == ["High confidence spread among agents"]
+        assert analysis.requires_manual_review is True
+
+
+class TestCalculateStrict:
+    """Tests for StrictConsensusEngine.calculate_strict()."""
+
+    def test_provable_data(self):
+        """Consensus and provable data for a 3-1 split."""
+        engine = StrictConsensusEngine(StrictConsensusConfig(min_agents=3))
+
+        consensus, provable = engine.calculate_strict(_mixed_results())
+
+        assert consensus.reached is True
+        assert provable.tier_distribution == {"tier_1": 6, "tier_2": 4, "tier_3": 1, "tier_4_5": 3}
+        assert provable.disagreement is not None
+        assert provable.disagreement.outcome_distribution == {"YES": 3, "NO": 1}
+        assert provable.disagreement.confidence_stats == {
+            "min": 0.5,
+            "max": 0.9,
+            "mean": pytest.approx(0.7625),
+            "spread": pytest.approx(0.4),
+        }
+        assert provable.disagreement.conflicting_evidence == [
+            {
+                "outcomes": ["YES", "NO"],
+                "shared_sources": [
+                    "https://reuters.com/b",
+                    "https://blog.example/c",
+                    "https://snopes.com/d",
+                ],
+                "interpretation_conflict": True,
+            }
+        ]
+        assert provable._data_hash is None  # not hashed until read
+        assert provable.data_hash == provable.calculate_hash()
+        assert provable.model_dump()["data_hash"] == provable.data_hash
+
+    def test_provable_data_is_frozen(self):
+        """Fields cannot be reassigned once the hash may have been read."""
+        _, provable = StrictConsensusEngine().calculate_strict(_mixed_results())
+
+        with pytest.raises(ValidationError):
+            provable.outcome = "NO"
+        with pytest.raises(ValidationError):
+            provable.verification.passed = False